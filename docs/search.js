@@ -1,6 +1,6 @@
 window.pdocSearch = (function(){
 /** elasticlunr - http://weixsong.github.io * Copyright (C) 2017 Oliver Nightingale * Copyright (C) 2017 Wei Song * MIT Licensed */!function(){function e(e){if(null===e||"object"!=typeof e)return e;var t=e.constructor();for(var n in e)e.hasOwnProperty(n)&&(t[n]=e[n]);return t}var t=function(e){var n=new t.Index;return n.pipeline.add(t.trimmer,t.stopWordFilter,t.stemmer),e&&e.call(n,n),n};t.version="0.9.5",lunr=t,t.utils={},t.utils.warn=function(e){return function(t){e.console&&console.warn&&console.warn(t)}}(this),t.utils.toString=function(e){return void 0===e||null===e?"":e.toString()},t.EventEmitter=function(){this.events={}},t.EventEmitter.prototype.addListener=function(){var e=Array.prototype.slice.call(arguments),t=e.pop(),n=e;if("function"!=typeof t)throw new TypeError("last argument must be a function");n.forEach(function(e){this.hasHandler(e)||(this.events[e]=[]),this.events[e].push(t)},this)},t.EventEmitter.prototype.removeListener=function(e,t){if(this.hasHandler(e)){var n=this.events[e].indexOf(t);-1!==n&&(this.events[e].splice(n,1),0==this.events[e].length&&delete this.events[e])}},t.EventEmitter.prototype.emit=function(e){if(this.hasHandler(e)){var t=Array.prototype.slice.call(arguments,1);this.events[e].forEach(function(e){e.apply(void 0,t)},this)}},t.EventEmitter.prototype.hasHandler=function(e){return e in this.events},t.tokenizer=function(e){if(!arguments.length||null===e||void 0===e)return[];if(Array.isArray(e)){var n=e.filter(function(e){return null===e||void 0===e?!1:!0});n=n.map(function(e){return t.utils.toString(e).toLowerCase()});var i=[];return n.forEach(function(e){var n=e.split(t.tokenizer.seperator);i=i.concat(n)},this),i}return e.toString().trim().toLowerCase().split(t.tokenizer.seperator)},t.tokenizer.defaultSeperator=/[\s\-]+/,t.tokenizer.seperator=t.tokenizer.defaultSeperator,t.tokenizer.setSeperator=function(e){null!==e&&void 0!==e&&"object"==typeof e&&(t.tokenizer.seperator=e)},t.tokenizer.resetSeperator=function(){t.tokenizer.seperator=t.tokenizer.defaultSeperator},t.tokenizer.getSeperator=function(){return t.tokenizer.seperator},t.Pipeline=function(){this._queue=[]},t.Pipeline.registeredFunctions={},t.Pipeline.registerFunction=function(e,n){n in t.Pipeline.registeredFunctions&&t.utils.warn("Overwriting existing registered function: "+n),e.label=n,t.Pipeline.registeredFunctions[n]=e},t.Pipeline.getRegisteredFunction=function(e){return e in t.Pipeline.registeredFunctions!=!0?null:t.Pipeline.registeredFunctions[e]},t.Pipeline.warnIfFunctionNotRegistered=function(e){var n=e.label&&e.label in this.registeredFunctions;n||t.utils.warn("Function is not registered with pipeline. This may cause problems when serialising the index.\n",e)},t.Pipeline.load=function(e){var n=new t.Pipeline;return e.forEach(function(e){var i=t.Pipeline.getRegisteredFunction(e);if(!i)throw new Error("Cannot load un-registered function: "+e);n.add(i)}),n},t.Pipeline.prototype.add=function(){var e=Array.prototype.slice.call(arguments);e.forEach(function(e){t.Pipeline.warnIfFunctionNotRegistered(e),this._queue.push(e)},this)},t.Pipeline.prototype.after=function(e,n){t.Pipeline.warnIfFunctionNotRegistered(n);var i=this._queue.indexOf(e);if(-1===i)throw new Error("Cannot find existingFn");this._queue.splice(i+1,0,n)},t.Pipeline.prototype.before=function(e,n){t.Pipeline.warnIfFunctionNotRegistered(n);var i=this._queue.indexOf(e);if(-1===i)throw new Error("Cannot find existingFn");this._queue.splice(i,0,n)},t.Pipeline.prototype.remove=function(e){var t=this._queue.indexOf(e);-1!==t&&this._queue.splice(t,1)},t.Pipeline.prototype.run=function(e){for(var t=[],n=e.length,i=this._queue.length,o=0;n>o;o++){for(var r=e[o],s=0;i>s&&(r=this._queue[s](r,o,e),void 0!==r&&null!==r);s++);void 0!==r&&null!==r&&t.push(r)}return t},t.Pipeline.prototype.reset=function(){this._queue=[]},t.Pipeline.prototype.get=function(){return this._queue},t.Pipeline.prototype.toJSON=function(){return this._queue.map(function(e){return t.Pipeline.warnIfFunctionNotRegistered(e),e.label})},t.Index=function(){this._fields=[],this._ref="id",this.pipeline=new t.Pipeline,this.documentStore=new t.DocumentStore,this.index={},this.eventEmitter=new t.EventEmitter,this._idfCache={},this.on("add","remove","update",function(){this._idfCache={}}.bind(this))},t.Index.prototype.on=function(){var e=Array.prototype.slice.call(arguments);return this.eventEmitter.addListener.apply(this.eventEmitter,e)},t.Index.prototype.off=function(e,t){return this.eventEmitter.removeListener(e,t)},t.Index.load=function(e){e.version!==t.version&&t.utils.warn("version mismatch: current "+t.version+" importing "+e.version);var n=new this;n._fields=e.fields,n._ref=e.ref,n.documentStore=t.DocumentStore.load(e.documentStore),n.pipeline=t.Pipeline.load(e.pipeline),n.index={};for(var i in e.index)n.index[i]=t.InvertedIndex.load(e.index[i]);return n},t.Index.prototype.addField=function(e){return this._fields.push(e),this.index[e]=new t.InvertedIndex,this},t.Index.prototype.setRef=function(e){return this._ref=e,this},t.Index.prototype.saveDocument=function(e){return this.documentStore=new t.DocumentStore(e),this},t.Index.prototype.addDoc=function(e,n){if(e){var n=void 0===n?!0:n,i=e[this._ref];this.documentStore.addDoc(i,e),this._fields.forEach(function(n){var o=this.pipeline.run(t.tokenizer(e[n]));this.documentStore.addFieldLength(i,n,o.length);var r={};o.forEach(function(e){e in r?r[e]+=1:r[e]=1},this);for(var s in r){var u=r[s];u=Math.sqrt(u),this.index[n].addToken(s,{ref:i,tf:u})}},this),n&&this.eventEmitter.emit("add",e,this)}},t.Index.prototype.removeDocByRef=function(e){if(e&&this.documentStore.isDocStored()!==!1&&this.documentStore.hasDoc(e)){var t=this.documentStore.getDoc(e);this.removeDoc(t,!1)}},t.Index.prototype.removeDoc=function(e,n){if(e){var n=void 0===n?!0:n,i=e[this._ref];this.documentStore.hasDoc(i)&&(this.documentStore.removeDoc(i),this._fields.forEach(function(n){var o=this.pipeline.run(t.tokenizer(e[n]));o.forEach(function(e){this.index[n].removeToken(e,i)},this)},this),n&&this.eventEmitter.emit("remove",e,this))}},t.Index.prototype.updateDoc=function(e,t){var t=void 0===t?!0:t;this.removeDocByRef(e[this._ref],!1),this.addDoc(e,!1),t&&this.eventEmitter.emit("update",e,this)},t.Index.prototype.idf=function(e,t){var n="@"+t+"/"+e;if(Object.prototype.hasOwnProperty.call(this._idfCache,n))return this._idfCache[n];var i=this.index[t].getDocFreq(e),o=1+Math.log(this.documentStore.length/(i+1));return this._idfCache[n]=o,o},t.Index.prototype.getFields=function(){return this._fields.slice()},t.Index.prototype.search=function(e,n){if(!e)return[];e="string"==typeof e?{any:e}:JSON.parse(JSON.stringify(e));var i=null;null!=n&&(i=JSON.stringify(n));for(var o=new t.Configuration(i,this.getFields()).get(),r={},s=Object.keys(e),u=0;u<s.length;u++){var a=s[u];r[a]=this.pipeline.run(t.tokenizer(e[a]))}var l={};for(var c in o){var d=r[c]||r.any;if(d){var f=this.fieldSearch(d,c,o),h=o[c].boost;for(var p in f)f[p]=f[p]*h;for(var p in f)p in l?l[p]+=f[p]:l[p]=f[p]}}var v,g=[];for(var p in l)v={ref:p,score:l[p]},this.documentStore.hasDoc(p)&&(v.doc=this.documentStore.getDoc(p)),g.push(v);return g.sort(function(e,t){return t.score-e.score}),g},t.Index.prototype.fieldSearch=function(e,t,n){var i=n[t].bool,o=n[t].expand,r=n[t].boost,s=null,u={};return 0!==r?(e.forEach(function(e){var n=[e];1==o&&(n=this.index[t].expandToken(e));var r={};n.forEach(function(n){var o=this.index[t].getDocs(n),a=this.idf(n,t);if(s&&"AND"==i){var l={};for(var c in s)c in o&&(l[c]=o[c]);o=l}n==e&&this.fieldSearchStats(u,n,o);for(var c in o){var d=this.index[t].getTermFrequency(n,c),f=this.documentStore.getFieldLength(c,t),h=1;0!=f&&(h=1/Math.sqrt(f));var p=1;n!=e&&(p=.15*(1-(n.length-e.length)/n.length));var v=d*a*h*p;c in r?r[c]+=v:r[c]=v}},this),s=this.mergeScores(s,r,i)},this),s=this.coordNorm(s,u,e.length)):void 0},t.Index.prototype.mergeScores=function(e,t,n){if(!e)return t;if("AND"==n){var i={};for(var o in t)o in e&&(i[o]=e[o]+t[o]);return i}for(var o in t)o in e?e[o]+=t[o]:e[o]=t[o];return e},t.Index.prototype.fieldSearchStats=function(e,t,n){for(var i in n)i in e?e[i].push(t):e[i]=[t]},t.Index.prototype.coordNorm=function(e,t,n){for(var i in e)if(i in t){var o=t[i].length;e[i]=e[i]*o/n}return e},t.Index.prototype.toJSON=function(){var e={};return this._fields.forEach(function(t){e[t]=this.index[t].toJSON()},this),{version:t.version,fields:this._fields,ref:this._ref,documentStore:this.documentStore.toJSON(),index:e,pipeline:this.pipeline.toJSON()}},t.Index.prototype.use=function(e){var t=Array.prototype.slice.call(arguments,1);t.unshift(this),e.apply(this,t)},t.DocumentStore=function(e){this._save=null===e||void 0===e?!0:e,this.docs={},this.docInfo={},this.length=0},t.DocumentStore.load=function(e){var t=new this;return t.length=e.length,t.docs=e.docs,t.docInfo=e.docInfo,t._save=e.save,t},t.DocumentStore.prototype.isDocStored=function(){return this._save},t.DocumentStore.prototype.addDoc=function(t,n){this.hasDoc(t)||this.length++,this.docs[t]=this._save===!0?e(n):null},t.DocumentStore.prototype.getDoc=function(e){return this.hasDoc(e)===!1?null:this.docs[e]},t.DocumentStore.prototype.hasDoc=function(e){return e in this.docs},t.DocumentStore.prototype.removeDoc=function(e){this.hasDoc(e)&&(delete this.docs[e],delete this.docInfo[e],this.length--)},t.DocumentStore.prototype.addFieldLength=function(e,t,n){null!==e&&void 0!==e&&0!=this.hasDoc(e)&&(this.docInfo[e]||(this.docInfo[e]={}),this.docInfo[e][t]=n)},t.DocumentStore.prototype.updateFieldLength=function(e,t,n){null!==e&&void 0!==e&&0!=this.hasDoc(e)&&this.addFieldLength(e,t,n)},t.DocumentStore.prototype.getFieldLength=function(e,t){return null===e||void 0===e?0:e in this.docs&&t in this.docInfo[e]?this.docInfo[e][t]:0},t.DocumentStore.prototype.toJSON=function(){return{docs:this.docs,docInfo:this.docInfo,length:this.length,save:this._save}},t.stemmer=function(){var e={ational:"ate",tional:"tion",enci:"ence",anci:"ance",izer:"ize",bli:"ble",alli:"al",entli:"ent",eli:"e",ousli:"ous",ization:"ize",ation:"ate",ator:"ate",alism:"al",iveness:"ive",fulness:"ful",ousness:"ous",aliti:"al",iviti:"ive",biliti:"ble",logi:"log"},t={icate:"ic",ative:"",alize:"al",iciti:"ic",ical:"ic",ful:"",ness:""},n="[^aeiou]",i="[aeiouy]",o=n+"[^aeiouy]*",r=i+"[aeiou]*",s="^("+o+")?"+r+o,u="^("+o+")?"+r+o+"("+r+")?$",a="^("+o+")?"+r+o+r+o,l="^("+o+")?"+i,c=new RegExp(s),d=new RegExp(a),f=new RegExp(u),h=new RegExp(l),p=/^(.+?)(ss|i)es$/,v=/^(.+?)([^s])s$/,g=/^(.+?)eed$/,m=/^(.+?)(ed|ing)$/,y=/.$/,S=/(at|bl|iz)$/,x=new RegExp("([^aeiouylsz])\\1$"),w=new RegExp("^"+o+i+"[^aeiouwxy]$"),I=/^(.+?[^aeiou])y$/,b=/^(.+?)(ational|tional|enci|anci|izer|bli|alli|entli|eli|ousli|ization|ation|ator|alism|iveness|fulness|ousness|aliti|iviti|biliti|logi)$/,E=/^(.+?)(icate|ative|alize|iciti|ical|ful|ness)$/,D=/^(.+?)(al|ance|ence|er|ic|able|ible|ant|ement|ment|ent|ou|ism|ate|iti|ous|ive|ize)$/,F=/^(.+?)(s|t)(ion)$/,_=/^(.+?)e$/,P=/ll$/,k=new RegExp("^"+o+i+"[^aeiouwxy]$"),z=function(n){var i,o,r,s,u,a,l;if(n.length<3)return n;if(r=n.substr(0,1),"y"==r&&(n=r.toUpperCase()+n.substr(1)),s=p,u=v,s.test(n)?n=n.replace(s,"$1$2"):u.test(n)&&(n=n.replace(u,"$1$2")),s=g,u=m,s.test(n)){var z=s.exec(n);s=c,s.test(z[1])&&(s=y,n=n.replace(s,""))}else if(u.test(n)){var z=u.exec(n);i=z[1],u=h,u.test(i)&&(n=i,u=S,a=x,l=w,u.test(n)?n+="e":a.test(n)?(s=y,n=n.replace(s,"")):l.test(n)&&(n+="e"))}if(s=I,s.test(n)){var z=s.exec(n);i=z[1],n=i+"i"}if(s=b,s.test(n)){var z=s.exec(n);i=z[1],o=z[2],s=c,s.test(i)&&(n=i+e[o])}if(s=E,s.test(n)){var z=s.exec(n);i=z[1],o=z[2],s=c,s.test(i)&&(n=i+t[o])}if(s=D,u=F,s.test(n)){var z=s.exec(n);i=z[1],s=d,s.test(i)&&(n=i)}else if(u.test(n)){var z=u.exec(n);i=z[1]+z[2],u=d,u.test(i)&&(n=i)}if(s=_,s.test(n)){var z=s.exec(n);i=z[1],s=d,u=f,a=k,(s.test(i)||u.test(i)&&!a.test(i))&&(n=i)}return s=P,u=d,s.test(n)&&u.test(n)&&(s=y,n=n.replace(s,"")),"y"==r&&(n=r.toLowerCase()+n.substr(1)),n};return z}(),t.Pipeline.registerFunction(t.stemmer,"stemmer"),t.stopWordFilter=function(e){return e&&t.stopWordFilter.stopWords[e]!==!0?e:void 0},t.clearStopWords=function(){t.stopWordFilter.stopWords={}},t.addStopWords=function(e){null!=e&&Array.isArray(e)!==!1&&e.forEach(function(e){t.stopWordFilter.stopWords[e]=!0},this)},t.resetStopWords=function(){t.stopWordFilter.stopWords=t.defaultStopWords},t.defaultStopWords={"":!0,a:!0,able:!0,about:!0,across:!0,after:!0,all:!0,almost:!0,also:!0,am:!0,among:!0,an:!0,and:!0,any:!0,are:!0,as:!0,at:!0,be:!0,because:!0,been:!0,but:!0,by:!0,can:!0,cannot:!0,could:!0,dear:!0,did:!0,"do":!0,does:!0,either:!0,"else":!0,ever:!0,every:!0,"for":!0,from:!0,get:!0,got:!0,had:!0,has:!0,have:!0,he:!0,her:!0,hers:!0,him:!0,his:!0,how:!0,however:!0,i:!0,"if":!0,"in":!0,into:!0,is:!0,it:!0,its:!0,just:!0,least:!0,let:!0,like:!0,likely:!0,may:!0,me:!0,might:!0,most:!0,must:!0,my:!0,neither:!0,no:!0,nor:!0,not:!0,of:!0,off:!0,often:!0,on:!0,only:!0,or:!0,other:!0,our:!0,own:!0,rather:!0,said:!0,say:!0,says:!0,she:!0,should:!0,since:!0,so:!0,some:!0,than:!0,that:!0,the:!0,their:!0,them:!0,then:!0,there:!0,these:!0,they:!0,"this":!0,tis:!0,to:!0,too:!0,twas:!0,us:!0,wants:!0,was:!0,we:!0,were:!0,what:!0,when:!0,where:!0,which:!0,"while":!0,who:!0,whom:!0,why:!0,will:!0,"with":!0,would:!0,yet:!0,you:!0,your:!0},t.stopWordFilter.stopWords=t.defaultStopWords,t.Pipeline.registerFunction(t.stopWordFilter,"stopWordFilter"),t.trimmer=function(e){if(null===e||void 0===e)throw new Error("token should not be undefined");return e.replace(/^\W+/,"").replace(/\W+$/,"")},t.Pipeline.registerFunction(t.trimmer,"trimmer"),t.InvertedIndex=function(){this.root={docs:{},df:0}},t.InvertedIndex.load=function(e){var t=new this;return t.root=e.root,t},t.InvertedIndex.prototype.addToken=function(e,t,n){for(var n=n||this.root,i=0;i<=e.length-1;){var o=e[i];o in n||(n[o]={docs:{},df:0}),i+=1,n=n[o]}var r=t.ref;n.docs[r]?n.docs[r]={tf:t.tf}:(n.docs[r]={tf:t.tf},n.df+=1)},t.InvertedIndex.prototype.hasToken=function(e){if(!e)return!1;for(var t=this.root,n=0;n<e.length;n++){if(!t[e[n]])return!1;t=t[e[n]]}return!0},t.InvertedIndex.prototype.getNode=function(e){if(!e)return null;for(var t=this.root,n=0;n<e.length;n++){if(!t[e[n]])return null;t=t[e[n]]}return t},t.InvertedIndex.prototype.getDocs=function(e){var t=this.getNode(e);return null==t?{}:t.docs},t.InvertedIndex.prototype.getTermFrequency=function(e,t){var n=this.getNode(e);return null==n?0:t in n.docs?n.docs[t].tf:0},t.InvertedIndex.prototype.getDocFreq=function(e){var t=this.getNode(e);return null==t?0:t.df},t.InvertedIndex.prototype.removeToken=function(e,t){if(e){var n=this.getNode(e);null!=n&&t in n.docs&&(delete n.docs[t],n.df-=1)}},t.InvertedIndex.prototype.expandToken=function(e,t,n){if(null==e||""==e)return[];var t=t||[];if(void 0==n&&(n=this.getNode(e),null==n))return t;n.df>0&&t.push(e);for(var i in n)"docs"!==i&&"df"!==i&&this.expandToken(e+i,t,n[i]);return t},t.InvertedIndex.prototype.toJSON=function(){return{root:this.root}},t.Configuration=function(e,n){var e=e||"";if(void 0==n||null==n)throw new Error("fields should not be null");this.config={};var i;try{i=JSON.parse(e),this.buildUserConfig(i,n)}catch(o){t.utils.warn("user configuration parse failed, will use default configuration"),this.buildDefaultConfig(n)}},t.Configuration.prototype.buildDefaultConfig=function(e){this.reset(),e.forEach(function(e){this.config[e]={boost:1,bool:"OR",expand:!1}},this)},t.Configuration.prototype.buildUserConfig=function(e,n){var i="OR",o=!1;if(this.reset(),"bool"in e&&(i=e.bool||i),"expand"in e&&(o=e.expand||o),"fields"in e)for(var r in e.fields)if(n.indexOf(r)>-1){var s=e.fields[r],u=o;void 0!=s.expand&&(u=s.expand),this.config[r]={boost:s.boost||0===s.boost?s.boost:1,bool:s.bool||i,expand:u}}else t.utils.warn("field name in user configuration not found in index instance fields");else this.addAllFields2UserConfig(i,o,n)},t.Configuration.prototype.addAllFields2UserConfig=function(e,t,n){n.forEach(function(n){this.config[n]={boost:1,bool:e,expand:t}},this)},t.Configuration.prototype.get=function(){return this.config},t.Configuration.prototype.reset=function(){this.config={}},lunr.SortedSet=function(){this.length=0,this.elements=[]},lunr.SortedSet.load=function(e){var t=new this;return t.elements=e,t.length=e.length,t},lunr.SortedSet.prototype.add=function(){var e,t;for(e=0;e<arguments.length;e++)t=arguments[e],~this.indexOf(t)||this.elements.splice(this.locationFor(t),0,t);this.length=this.elements.length},lunr.SortedSet.prototype.toArray=function(){return this.elements.slice()},lunr.SortedSet.prototype.map=function(e,t){return this.elements.map(e,t)},lunr.SortedSet.prototype.forEach=function(e,t){return this.elements.forEach(e,t)},lunr.SortedSet.prototype.indexOf=function(e){for(var t=0,n=this.elements.length,i=n-t,o=t+Math.floor(i/2),r=this.elements[o];i>1;){if(r===e)return o;e>r&&(t=o),r>e&&(n=o),i=n-t,o=t+Math.floor(i/2),r=this.elements[o]}return r===e?o:-1},lunr.SortedSet.prototype.locationFor=function(e){for(var t=0,n=this.elements.length,i=n-t,o=t+Math.floor(i/2),r=this.elements[o];i>1;)e>r&&(t=o),r>e&&(n=o),i=n-t,o=t+Math.floor(i/2),r=this.elements[o];return r>e?o:e>r?o+1:void 0},lunr.SortedSet.prototype.intersect=function(e){for(var t=new lunr.SortedSet,n=0,i=0,o=this.length,r=e.length,s=this.elements,u=e.elements;;){if(n>o-1||i>r-1)break;s[n]!==u[i]?s[n]<u[i]?n++:s[n]>u[i]&&i++:(t.add(s[n]),n++,i++)}return t},lunr.SortedSet.prototype.clone=function(){var e=new lunr.SortedSet;return e.elements=this.toArray(),e.length=e.elements.length,e},lunr.SortedSet.prototype.union=function(e){var t,n,i;this.length>=e.length?(t=this,n=e):(t=e,n=this),i=t.clone();for(var o=0,r=n.toArray();o<r.length;o++)i.add(r[o]);return i},lunr.SortedSet.prototype.toJSON=function(){return this.toArray()},function(e,t){"function"==typeof define&&define.amd?define(t):"object"==typeof exports?module.exports=t():e.elasticlunr=t()}(this,function(){return t})}();
-    /** pdoc search index */const docs = [{"fullname": "toy_robot", "modulename": "toy_robot", "kind": "module", "doc": "<p></p>\n"}, {"fullname": "toy_robot.grid", "modulename": "toy_robot.grid", "kind": "module", "doc": "<p></p>\n"}, {"fullname": "toy_robot.grid.Cell", "modulename": "toy_robot.grid", "qualname": "Cell", "kind": "class", "doc": "<p>Represents a cell in a grid.</p>\n"}, {"fullname": "toy_robot.grid.Cell.__init__", "modulename": "toy_robot.grid", "qualname": "Cell.__init__", "kind": "function", "doc": "<p>Initialise a cell at a given (x, y) coordinate.</p>\n\n<p>Args:\n    x (int): The horizontal position of the cell.\n    y (int): The vertical position of the cell.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">x</span><span class=\"p\">:</span> <span class=\"nb\">int</span>, </span><span class=\"param\"><span class=\"n\">y</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, {"fullname": "toy_robot.grid.Cell.set_neighbour", "modulename": "toy_robot.grid", "qualname": "Cell.set_neighbour", "kind": "function", "doc": "<p>Set the neighbouring cell at a specific direction.</p>\n\n<p>Args:\n    neighbour (Cell): The neighbouring cell.\n    direction (Direction): The neighbouring direction.\nRaises:\n    RuntimeError if neighbour already exists in neighbouring direction</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">neighbour</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">Cell</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"kc\">None</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.Cell.get_neighbour", "modulename": "toy_robot.grid", "qualname": "Cell.get_neighbour", "kind": "function", "doc": "<p>Gets neighbouring cell in specific direction.</p>\n\n<p>Args:\n    direction (Direction): The neighbouring direction.\nReturns:\n    Cell: Neigbouring cell, or None if no neighbouring cell in direction.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">Cell</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.Cell.get_coordinates", "modulename": "toy_robot.grid", "qualname": "Cell.get_coordinates", "kind": "function", "doc": "<p>Gets coordinates of the cell.</p>\n\n<p>Returns:\n    Coordinates: Coordinates of the cell.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.AbstractGrid", "modulename": "toy_robot.grid", "qualname": "AbstractGrid", "kind": "class", "doc": "<p>Abstract class for grid like structure that consists of Cell type objects.</p>\n", "bases": "abc.ABC"}, {"fullname": "toy_robot.grid.AbstractGrid.get_next_cell_coordinates", "modulename": "toy_robot.grid", "qualname": "AbstractGrid.get_next_cell_coordinates", "kind": "function", "doc": "<p>Queries grid structure for neighbouring cell coordinates.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\n    direction (Direction): Direction of current's cell neighbour\nReturns:\n    Coordinates: Coordinates of neighbouring cell, or None if cell does not exist.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.AbstractGrid.is_valid_cell", "modulename": "toy_robot.grid", "qualname": "AbstractGrid.is_valid_cell", "kind": "function", "doc": "<p>Queries grid structure if cell coordinates are valid.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of querried cell.\nReturns:\n    bool: True if coordinates cooresponds to valid cell, False if not.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.SquareGrid", "modulename": "toy_robot.grid", "qualname": "SquareGrid", "kind": "class", "doc": "<p>Implementation of AbstractGrid interface for a square grid.</p>\n", "bases": "AbstractGrid"}, {"fullname": "toy_robot.grid.SquareGrid.__init__", "modulename": "toy_robot.grid", "qualname": "SquareGrid.__init__", "kind": "function", "doc": "<p>Initialises SquareGrid class.</p>\n\n<p>Args:\n    size (int): Size of square grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">size</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, {"fullname": "toy_robot.grid.SquareGrid.get_next_cell_coordinates", "modulename": "toy_robot.grid", "qualname": "SquareGrid.get_next_cell_coordinates", "kind": "function", "doc": "<p>Queries grid structure for neighbouring cell coordinates.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\n    direction (Direction): Direction of current's cell neighbour\nReturns:\n    Coordinates: Coordinates of neighbouring cell, or None if cell does not exist.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.grid.SquareGrid.is_valid_cell", "modulename": "toy_robot.grid", "qualname": "SquareGrid.is_valid_cell", "kind": "function", "doc": "<p>Queries grid structure if cell coordinates are valid.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\nReturns:\n    bool: True if coordinates coorespond to valid cell, False if not.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot", "modulename": "toy_robot.toy_robot", "kind": "module", "doc": "<p></p>\n"}, {"fullname": "toy_robot.toy_robot.RobotRotation", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation", "kind": "class", "doc": "<p>Enumeration representing the possible robot rotations.</p>\n", "bases": "enum.Enum"}, {"fullname": "toy_robot.toy_robot.RobotRotation.RIGHT", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation.RIGHT", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;RobotRotation.RIGHT: (0,)&gt;"}, {"fullname": "toy_robot.toy_robot.RobotRotation.LEFT", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation.LEFT", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;RobotRotation.LEFT: 1&gt;"}, {"fullname": "toy_robot.toy_robot.RobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "RobotCommand", "kind": "class", "doc": "<p>Abstract class for robot command</p>\n", "bases": "abc.ABC"}, {"fullname": "toy_robot.toy_robot.RobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "RobotCommand.execute", "kind": "function", "doc": "<p>Executes a robot command.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.NopRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "NopRobotCommand", "kind": "class", "doc": "<p>Abstract class for robot command</p>\n", "bases": "RobotCommand"}, {"fullname": "toy_robot.toy_robot.NopRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "NopRobotCommand.execute", "kind": "function", "doc": "<p>No operation robot command.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: Returns always true.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.PlaceRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand", "kind": "class", "doc": "<p>Implements a robot place command</p>\n", "bases": "RobotCommand"}, {"fullname": "toy_robot.toy_robot.PlaceRobotCommand.__init__", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand.__init__", "kind": "function", "doc": "<p>Initialises a robot placement command.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span>)</span>"}, {"fullname": "toy_robot.toy_robot.PlaceRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand.execute", "kind": "function", "doc": "<p>Places the robot on the grid.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.MoveRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "MoveRobotCommand", "kind": "class", "doc": "<p>Implements a robot move command</p>\n", "bases": "RobotCommand"}, {"fullname": "toy_robot.toy_robot.MoveRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "MoveRobotCommand.execute", "kind": "function", "doc": "<p>Moves robot to next grid cell.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.TurnRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand", "kind": "class", "doc": "<p>Implements a robot turn command</p>\n", "bases": "RobotCommand"}, {"fullname": "toy_robot.toy_robot.TurnRobotCommand.__init__", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand.__init__", "kind": "function", "doc": "<p>Initialises a robot rotation command.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">robot_rotation</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotRotation</span></span>)</span>"}, {"fullname": "toy_robot.toy_robot.TurnRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand.execute", "kind": "function", "doc": "<p>Rotates robot clockwise or counter clockwise.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.ReportRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "ReportRobotCommand", "kind": "class", "doc": "<p>Implements a robot report command</p>\n", "bases": "RobotCommand"}, {"fullname": "toy_robot.toy_robot.ReportRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "ReportRobotCommand.execute", "kind": "function", "doc": "<p>Makes robot report position and direction.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.AbastractRobotApiHandler", "modulename": "toy_robot.toy_robot", "qualname": "AbastractRobotApiHandler", "kind": "class", "doc": "<p>Class that generates robot commands from API</p>\n", "bases": "abc.ABC"}, {"fullname": "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command", "modulename": "toy_robot.toy_robot", "qualname": "AbastractRobotApiHandler.generate_command", "kind": "function", "doc": "<p>Generates robot command based on API specifics.</p>\n\n<p>Args:\n    data(Any): Data specific to API for command generation.\nReturns:\n    RobotCommand: Robot command generated</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">data</span><span class=\"p\">:</span> <span class=\"n\">Any</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.RobotApiHandler", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler", "kind": "class", "doc": "<p>Class that generates robot commands from string commands.</p>\n", "bases": "AbastractRobotApiHandler"}, {"fullname": "toy_robot.toy_robot.RobotApiHandler.initialised", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler.initialised", "kind": "variable", "doc": "<p></p>\n", "default_value": "False"}, {"fullname": "toy_robot.toy_robot.RobotApiHandler.generate_command", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler.generate_command", "kind": "function", "doc": "<p>Generates robot command based on API specifics.\nArgs:\n    data(str): Data specific to API for command generation.\nReturns:\n    RobotCommand: Robot command generated.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">cls</span>, </span><span class=\"param\"><span class=\"n\">command</span><span class=\"p\">:</span> <span class=\"nb\">str</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.AbstractCommandReceiver", "modulename": "toy_robot.toy_robot", "qualname": "AbstractCommandReceiver", "kind": "class", "doc": "<p>Abstract class for command receiver.</p>\n", "bases": "abc.ABC"}, {"fullname": "toy_robot.toy_robot.AbstractCommandReceiver.recv", "modulename": "toy_robot.toy_robot", "qualname": "AbstractCommandReceiver.recv", "kind": "function", "doc": "<p>Returns:\n    RobotCommand: Returns the robot command received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver", "kind": "class", "doc": "<p>Abstract class for command receiver.</p>\n", "bases": "AbstractCommandReceiver"}, {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver.__init__", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver.__init__", "kind": "function", "doc": "<p></p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">file</span><span class=\"p\">:</span> <span class=\"nb\">str</span>,</span><span class=\"param\">\tapi_handler: toy_robot.toy_robot.AbastractRobotApiHandler = &lt;class &#x27;toy_robot.toy_robot.RobotApiHandler&#x27;&gt;</span>)</span>"}, {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver.recv", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver.recv", "kind": "function", "doc": "<p>Returns:\n    RobotCommand: Returns the robot command received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.Robot", "modulename": "toy_robot.toy_robot", "qualname": "Robot", "kind": "class", "doc": "<p>Class that implements a robot on a grid like structure</p>\n"}, {"fullname": "toy_robot.toy_robot.Robot.__init__", "modulename": "toy_robot.toy_robot", "qualname": "Robot.__init__", "kind": "function", "doc": "<p>Initialises the toy robot.</p>\n\n<p>Args:\n    grid(AbstractGrid): Grid for the robo to to be placed.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">grid</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">AbstractGrid</span>,</span><span class=\"param\">\t<span class=\"n\">command_receiver</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">AbstractCommandReceiver</span></span>)</span>"}, {"fullname": "toy_robot.toy_robot.Robot.direction", "modulename": "toy_robot.toy_robot", "qualname": "Robot.direction", "kind": "variable", "doc": "<p>Get direction</p>\n", "annotation": ": toy_robot.utils.Direction"}, {"fullname": "toy_robot.toy_robot.Robot.coordinates", "modulename": "toy_robot.toy_robot", "qualname": "Robot.coordinates", "kind": "variable", "doc": "<p>Get coordinates</p>\n"}, {"fullname": "toy_robot.toy_robot.Robot.is_on_grid", "modulename": "toy_robot.toy_robot", "qualname": "Robot.is_on_grid", "kind": "function", "doc": "<p>Checks if a robot has a valid grid position</p>\n\n<p>Returns:\n    bool: Returns true if robot has been placed on the grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.Robot.get_grid", "modulename": "toy_robot.toy_robot", "qualname": "Robot.get_grid", "kind": "function", "doc": "<p>Get grid</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">AbstractGrid</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.Robot.spin", "modulename": "toy_robot.toy_robot", "qualname": "Robot.spin", "kind": "function", "doc": "<p>Spin robot to run through the commands. Exits when no more commands to be received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory", "kind": "class", "doc": "<p>Simple factory for application.</p>\n"}, {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.__init__", "kind": "function", "doc": "<p>Initialises factory</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">()</span>"}, {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.add_square_grid", "kind": "function", "doc": "<p>Adds a square grid for the robot:</p>\n\n<p>Args:\n    grid_size(int): Size of square grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">grid_size</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">SimpleRobotOnGridFactory</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.add_stub_command_receiver", "kind": "function", "doc": "<p>Adds a stub file receiver for testing.</p>\n\n<p>Args:\n    file(str): Path to file containing instructions.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">file</span><span class=\"p\">:</span> <span class=\"nb\">str</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.create_robot", "kind": "function", "doc": "<p>Adds a square grid for the robot:</p>\n\n<p>Args:\n    grid_size(int): Size of square grid.\nRaises:\n    Runtime error if grid or command receiver are not initaliased.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">SimpleRobotOnGridFactory</span>:</span></span>", "funcdef": "def"}, {"fullname": "toy_robot.utils", "modulename": "toy_robot.utils", "kind": "module", "doc": "<p></p>\n"}, {"fullname": "toy_robot.utils.Direction", "modulename": "toy_robot.utils", "qualname": "Direction", "kind": "class", "doc": "<p>Possible directions of toy robot.</p>\n", "bases": "enum.Enum"}, {"fullname": "toy_robot.utils.Direction.WEST", "modulename": "toy_robot.utils", "qualname": "Direction.WEST", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.WEST: 1&gt;"}, {"fullname": "toy_robot.utils.Direction.EAST", "modulename": "toy_robot.utils", "qualname": "Direction.EAST", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.EAST: 2&gt;"}, {"fullname": "toy_robot.utils.Direction.NORTH", "modulename": "toy_robot.utils", "qualname": "Direction.NORTH", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.NORTH: 3&gt;"}, {"fullname": "toy_robot.utils.Direction.SOUTH", "modulename": "toy_robot.utils", "qualname": "Direction.SOUTH", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.SOUTH: 4&gt;"}, {"fullname": "toy_robot.utils.Direction.opposite", "modulename": "toy_robot.utils", "qualname": "Direction.opposite", "kind": "variable", "doc": "<p>Property to retrieve the opposite of the current direction.</p>\n"}, {"fullname": "toy_robot.utils.Direction.counter_clockwise", "modulename": "toy_robot.utils", "qualname": "Direction.counter_clockwise", "kind": "variable", "doc": "<p>Property to retrieve the clockwise direction of the current direction.</p>\n"}, {"fullname": "toy_robot.utils.Direction.clockwise", "modulename": "toy_robot.utils", "qualname": "Direction.clockwise", "kind": "variable", "doc": "<p>Property to retrieve the counter clockwise direction of the current direction.</p>\n"}, {"fullname": "toy_robot.utils.Coordinates", "modulename": "toy_robot.utils", "qualname": "Coordinates", "kind": "class", "doc": "<p>Dataclass representing coordinates on a grid system.</p>\n"}, {"fullname": "toy_robot.utils.Coordinates.__init__", "modulename": "toy_robot.utils", "qualname": "Coordinates.__init__", "kind": "function", "doc": "<p></p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">x</span><span class=\"p\">:</span> <span class=\"nb\">int</span>, </span><span class=\"param\"><span class=\"n\">y</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, {"fullname": "toy_robot.utils.Coordinates.x", "modulename": "toy_robot.utils", "qualname": "Coordinates.x", "kind": "variable", "doc": "<p></p>\n", "annotation": ": int"}, {"fullname": "toy_robot.utils.Coordinates.y", "modulename": "toy_robot.utils", "qualname": "Coordinates.y", "kind": "variable", "doc": "<p></p>\n", "annotation": ": int"}];
+    /** pdoc search index */const docs = {"version": "0.9.5", "fields": ["qualname", "fullname", "annotation", "default_value", "signature", "bases", "doc"], "ref": "fullname", "documentStore": {"docs": {"toy_robot": {"fullname": "toy_robot", "modulename": "toy_robot", "kind": "module", "doc": "<p>Toy robot moving on a grid. Requires Python 3.10 or later.</p>\n"}, "toy_robot.cell": {"fullname": "toy_robot.cell", "modulename": "toy_robot.cell", "kind": "module", "doc": "<p></p>\n"}, "toy_robot.cell.Cell": {"fullname": "toy_robot.cell.Cell", "modulename": "toy_robot.cell", "qualname": "Cell", "kind": "class", "doc": "<p>Represents a cell in a grid.</p>\n"}, "toy_robot.cell.Cell.__init__": {"fullname": "toy_robot.cell.Cell.__init__", "modulename": "toy_robot.cell", "qualname": "Cell.__init__", "kind": "function", "doc": "<p>Initialise a cell at a given (x, y) coordinate.</p>\n\n<p>Args:\n    x (int): The horizontal position of the cell.\n    y (int): The vertical position of the cell.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">x</span><span class=\"p\">:</span> <span class=\"nb\">int</span>, </span><span class=\"param\"><span class=\"n\">y</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, "toy_robot.cell.Cell.set_neighbour": {"fullname": "toy_robot.cell.Cell.set_neighbour", "modulename": "toy_robot.cell", "qualname": "Cell.set_neighbour", "kind": "function", "doc": "<p>Set the neighbouring cell at a specific direction.</p>\n\n<p>Args:\n    neighbour (Cell): The neighbouring cell.\n    direction (Direction): The neighbouring direction.\nRaises:\n    RuntimeError if neighbour already exists in neighbouring direction</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">neighbour</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">cell</span><span class=\"o\">.</span><span class=\"n\">Cell</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"kc\">None</span>:</span></span>", "funcdef": "def"}, "toy_robot.cell.Cell.get_neighbour": {"fullname": "toy_robot.cell.Cell.get_neighbour", "modulename": "toy_robot.cell", "qualname": "Cell.get_neighbour", "kind": "function", "doc": "<p>Gets neighbouring cell in specific direction.</p>\n\n<p>Args:\n    direction (Direction): The neighbouring direction.\nReturns:\n    Cell: Neigbouring cell, or None if no neighbouring cell in direction.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">cell</span><span class=\"o\">.</span><span class=\"n\">Cell</span>:</span></span>", "funcdef": "def"}, "toy_robot.cell.Cell.get_coordinates": {"fullname": "toy_robot.cell.Cell.get_coordinates", "modulename": "toy_robot.cell", "qualname": "Cell.get_coordinates", "kind": "function", "doc": "<p>Gets coordinates of the cell.</p>\n\n<p>Returns:\n    Coordinates: Coordinates of the cell. The instance is shared, not copied.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, "toy_robot.grid": {"fullname": "toy_robot.grid", "modulename": "toy_robot.grid", "kind": "module", "doc": "<p></p>\n"}, "toy_robot.grid.AbstractGrid": {"fullname": "toy_robot.grid.AbstractGrid", "modulename": "toy_robot.grid", "qualname": "AbstractGrid", "kind": "class", "doc": "<p>Abstract class for grid like structure of cells addressed by Coordinates.</p>\n", "bases": "abc.ABC"}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"fullname": "toy_robot.grid.AbstractGrid.get_next_cell_coordinates", "modulename": "toy_robot.grid", "qualname": "AbstractGrid.get_next_cell_coordinates", "kind": "function", "doc": "<p>Queries grid structure for neighbouring cell coordinates.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\n    direction (Direction): Direction of current's cell neighbour\nReturns:\n    Coordinates: Coordinates of neighbouring cell, or None if cell does not exist.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"fullname": "toy_robot.grid.AbstractGrid.is_valid_cell", "modulename": "toy_robot.grid", "qualname": "AbstractGrid.is_valid_cell", "kind": "function", "doc": "<p>Queries grid structure if cell coordinates are valid.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of querried cell.\nReturns:\n    bool: True if coordinates cooresponds to valid cell, False if not.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.grid.SquareGrid": {"fullname": "toy_robot.grid.SquareGrid", "modulename": "toy_robot.grid", "qualname": "SquareGrid", "kind": "class", "doc": "<p>Implementation of AbstractGrid interface for a square grid.</p>\n", "bases": "AbstractGrid"}, "toy_robot.grid.SquareGrid.__init__": {"fullname": "toy_robot.grid.SquareGrid.__init__", "modulename": "toy_robot.grid", "qualname": "SquareGrid.__init__", "kind": "function", "doc": "<p>Initialises SquareGrid class. Neighbouring cell lookups are cached,\nand computed upfront for grids of size up to 32.</p>\n\n<p>Args:\n    size (int): Size of square grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">size</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"fullname": "toy_robot.grid.SquareGrid.get_next_cell_coordinates", "modulename": "toy_robot.grid", "qualname": "SquareGrid.get_next_cell_coordinates", "kind": "function", "doc": "<p>Queries grid structure for neighbouring cell coordinates.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\n    direction (Direction): Direction of current's cell neighbour\nReturns:\n    Coordinates: Coordinates of neighbouring cell, or None if cell does not exist.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"bp\">self</span>,</span><span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>:</span></span>", "funcdef": "def"}, "toy_robot.grid.SquareGrid.is_valid_cell": {"fullname": "toy_robot.grid.SquareGrid.is_valid_cell", "modulename": "toy_robot.grid", "qualname": "SquareGrid.is_valid_cell", "kind": "function", "doc": "<p>Queries grid structure if cell coordinates are valid.</p>\n\n<p>Args:\n    coordinates (Coordinates): Coordinates of current cell.\nReturns:\n    bool: True if coordinates coorespond to valid cell, False if not.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot": {"fullname": "toy_robot.toy_robot", "modulename": "toy_robot.toy_robot", "kind": "module", "doc": "<p></p>\n"}, "toy_robot.toy_robot.logger": {"fullname": "toy_robot.toy_robot.logger", "modulename": "toy_robot.toy_robot", "qualname": "logger", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Logger toy_robot.toy_robot (WARNING)&gt;"}, "toy_robot.toy_robot.RobotRotation": {"fullname": "toy_robot.toy_robot.RobotRotation", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation", "kind": "class", "doc": "<p>Enumeration representing the possible robot rotations.</p>\n", "bases": "enum.Enum"}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"fullname": "toy_robot.toy_robot.RobotRotation.RIGHT", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation.RIGHT", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;RobotRotation.RIGHT: (0,)&gt;"}, "toy_robot.toy_robot.RobotRotation.LEFT": {"fullname": "toy_robot.toy_robot.RobotRotation.LEFT", "modulename": "toy_robot.toy_robot", "qualname": "RobotRotation.LEFT", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;RobotRotation.LEFT: 1&gt;"}, "toy_robot.toy_robot.RobotCommand": {"fullname": "toy_robot.toy_robot.RobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "RobotCommand", "kind": "class", "doc": "<p>Abstract class for robot command</p>\n", "bases": "abc.ABC"}, "toy_robot.toy_robot.RobotCommand.execute": {"fullname": "toy_robot.toy_robot.RobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "RobotCommand.execute", "kind": "function", "doc": "<p>Executes a robot command.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.NopRobotCommand": {"fullname": "toy_robot.toy_robot.NopRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "NopRobotCommand", "kind": "class", "doc": "<p>Abstract class for robot command</p>\n", "bases": "RobotCommand"}, "toy_robot.toy_robot.NopRobotCommand.execute": {"fullname": "toy_robot.toy_robot.NopRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "NopRobotCommand.execute", "kind": "function", "doc": "<p>No operation robot command.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: Returns always true.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.PlaceRobotCommand": {"fullname": "toy_robot.toy_robot.PlaceRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand", "kind": "class", "doc": "<p>Implements a robot place command</p>\n", "bases": "RobotCommand"}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"fullname": "toy_robot.toy_robot.PlaceRobotCommand.__init__", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand.__init__", "kind": "function", "doc": "<p>Initialises a robot placement command.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">coordinates</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Coordinates</span>,</span><span class=\"param\">\t<span class=\"n\">direction</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">utils</span><span class=\"o\">.</span><span class=\"n\">Direction</span></span>)</span>"}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"fullname": "toy_robot.toy_robot.PlaceRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "PlaceRobotCommand.execute", "kind": "function", "doc": "<p>Places the robot on the grid.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.MoveRobotCommand": {"fullname": "toy_robot.toy_robot.MoveRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "MoveRobotCommand", "kind": "class", "doc": "<p>Implements a robot move command</p>\n", "bases": "RobotCommand"}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"fullname": "toy_robot.toy_robot.MoveRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "MoveRobotCommand.execute", "kind": "function", "doc": "<p>Moves robot to next grid cell.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.TurnRobotCommand": {"fullname": "toy_robot.toy_robot.TurnRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand", "kind": "class", "doc": "<p>Implements a robot turn command</p>\n", "bases": "RobotCommand"}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"fullname": "toy_robot.toy_robot.TurnRobotCommand.__init__", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand.__init__", "kind": "function", "doc": "<p>Initialises a robot rotation command.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">robot_rotation</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotRotation</span></span>)</span>"}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"fullname": "toy_robot.toy_robot.TurnRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "TurnRobotCommand.execute", "kind": "function", "doc": "<p>Rotates robot clockwise or counter clockwise.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.ReportRobotCommand": {"fullname": "toy_robot.toy_robot.ReportRobotCommand", "modulename": "toy_robot.toy_robot", "qualname": "ReportRobotCommand", "kind": "class", "doc": "<p>Implements a robot report command</p>\n", "bases": "RobotCommand"}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"fullname": "toy_robot.toy_robot.ReportRobotCommand.execute", "modulename": "toy_robot.toy_robot", "qualname": "ReportRobotCommand.execute", "kind": "function", "doc": "<p>Makes robot report position and direction.</p>\n\n<p>Args:\n    robot(Robot): Robot to execute the command.\nReturns:\n    bool: True if operation was successful, False otherwise.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">robot</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">Robot</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"fullname": "toy_robot.toy_robot.AbastractRobotApiHandler", "modulename": "toy_robot.toy_robot", "qualname": "AbastractRobotApiHandler", "kind": "class", "doc": "<p>Class that generates robot commands from API</p>\n", "bases": "abc.ABC"}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"fullname": "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command", "modulename": "toy_robot.toy_robot", "qualname": "AbastractRobotApiHandler.generate_command", "kind": "function", "doc": "<p>Generates robot command based on API specifics.</p>\n\n<p>Args:\n    data(Any): Data specific to API for command generation.\nReturns:\n    RobotCommand: Robot command generated</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">data</span><span class=\"p\">:</span> <span class=\"n\">Any</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.RobotApiHandler": {"fullname": "toy_robot.toy_robot.RobotApiHandler", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler", "kind": "class", "doc": "<p>Class that generates robot commands from string commands.</p>\n", "bases": "AbastractRobotApiHandler"}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"fullname": "toy_robot.toy_robot.RobotApiHandler.api_generator_map", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler.api_generator_map", "kind": "variable", "doc": "<p></p>\n", "default_value": "{&#x27;PLACE&#x27;: &#x27;_generate_place_command&#x27;, &#x27;MOVE&#x27;: &#x27;_generate_move_command&#x27;, &#x27;LEFT&#x27;: &#x27;_generate_turn_command&#x27;, &#x27;RIGHT&#x27;: &#x27;_generate_turn_command&#x27;, &#x27;REPORT&#x27;: &#x27;_generate_report_command&#x27;}"}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"fullname": "toy_robot.toy_robot.RobotApiHandler.generate_command", "modulename": "toy_robot.toy_robot", "qualname": "RobotApiHandler.generate_command", "kind": "function", "doc": "<p>Generates robot command based on API specifics.\nArgs:\n    data(str): Data specific to API for command generation.\nReturns:\n    RobotCommand: Robot command generated.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">cls</span>, </span><span class=\"param\"><span class=\"n\">command</span><span class=\"p\">:</span> <span class=\"nb\">str</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.AbstractCommandReceiver": {"fullname": "toy_robot.toy_robot.AbstractCommandReceiver", "modulename": "toy_robot.toy_robot", "qualname": "AbstractCommandReceiver", "kind": "class", "doc": "<p>Abstract class for command receiver.</p>\n", "bases": "abc.ABC"}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"fullname": "toy_robot.toy_robot.AbstractCommandReceiver.recv", "modulename": "toy_robot.toy_robot", "qualname": "AbstractCommandReceiver.recv", "kind": "function", "doc": "<p>Returns:\n    RobotCommand: Returns the robot command received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.StubFileCommandReceiver": {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver", "kind": "class", "doc": "<p>Abstract class for command receiver.</p>\n", "bases": "AbstractCommandReceiver"}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver.__init__", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver.__init__", "kind": "function", "doc": "<p>Initialises the receiver. By default all commands in the file are\nparsed upfront, otherwise the file is read and parsed line by line\nas commands are received. A streaming receiver keeps the file open\nuntil all commands are received or close() is called.</p>\n\n<p>Args:\n    file(str): Path to file containing instructions.\n    api_handler(AbastractRobotApiHandler): Handler generating the robot commands.\n    stream(bool): Read commands lazily instead of parsing the whole file.\nRaises:\n    OSError if file can not be opened.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">file</span><span class=\"p\">:</span> <span class=\"nb\">str</span>,</span><span class=\"param\">\tapi_handler: toy_robot.toy_robot.AbastractRobotApiHandler = &lt;class &#x27;toy_robot.toy_robot.RobotApiHandler&#x27;&gt;,</span><span class=\"param\">\t<span class=\"n\">stream</span><span class=\"p\">:</span> <span class=\"nb\">bool</span> <span class=\"o\">=</span> <span class=\"kc\">False</span></span>)</span>"}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver.recv", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver.recv", "kind": "function", "doc": "<p>Returns:\n    RobotCommand: Returns the robot command received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">RobotCommand</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"fullname": "toy_robot.toy_robot.StubFileCommandReceiver.close", "modulename": "toy_robot.toy_robot", "qualname": "StubFileCommandReceiver.close", "kind": "function", "doc": "<p>Closes the instructions file. No more commands are received afterwards\nfrom a streaming receiver.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"kc\">None</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.Robot": {"fullname": "toy_robot.toy_robot.Robot", "modulename": "toy_robot.toy_robot", "qualname": "Robot", "kind": "class", "doc": "<p>Class that implements a robot on a grid like structure</p>\n"}, "toy_robot.toy_robot.Robot.__init__": {"fullname": "toy_robot.toy_robot.Robot.__init__", "modulename": "toy_robot.toy_robot", "qualname": "Robot.__init__", "kind": "function", "doc": "<p>Initialises the toy robot.</p>\n\n<p>Args:\n    grid(AbstractGrid): Grid for the robo to to be placed.\n    command_receiver(AbstractCommandReceiver): Receiver of robot commands.\n    output(TextIO): Stream for robot output, sys.stdout if None.</p>\n", "signature": "<span class=\"signature pdoc-code multiline\">(<span class=\"param\">\t<span class=\"n\">grid</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">AbstractGrid</span>,</span><span class=\"param\">\t<span class=\"n\">command_receiver</span><span class=\"p\">:</span> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">AbstractCommandReceiver</span>,</span><span class=\"param\">\t<span class=\"n\">output</span><span class=\"p\">:</span> <span class=\"n\">Optional</span><span class=\"p\">[</span><span class=\"n\">TextIO</span><span class=\"p\">]</span> <span class=\"o\">=</span> <span class=\"kc\">None</span></span>)</span>"}, "toy_robot.toy_robot.Robot.direction": {"fullname": "toy_robot.toy_robot.Robot.direction", "modulename": "toy_robot.toy_robot", "qualname": "Robot.direction", "kind": "variable", "doc": "<p>Get direction</p>\n", "annotation": ": toy_robot.utils.Direction"}, "toy_robot.toy_robot.Robot.coordinates": {"fullname": "toy_robot.toy_robot.Robot.coordinates", "modulename": "toy_robot.toy_robot", "qualname": "Robot.coordinates", "kind": "variable", "doc": "<p>Get coordinates</p>\n", "annotation": ": toy_robot.utils.Coordinates"}, "toy_robot.toy_robot.Robot.is_on_grid": {"fullname": "toy_robot.toy_robot.Robot.is_on_grid", "modulename": "toy_robot.toy_robot", "qualname": "Robot.is_on_grid", "kind": "function", "doc": "<p>Checks if a robot has a valid grid position</p>\n\n<p>Returns:\n    bool: Returns true if robot has been placed on the grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"nb\">bool</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.Robot.get_grid": {"fullname": "toy_robot.toy_robot.Robot.get_grid", "modulename": "toy_robot.toy_robot", "qualname": "Robot.get_grid", "kind": "function", "doc": "<p>Get grid</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">grid</span><span class=\"o\">.</span><span class=\"n\">AbstractGrid</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.Robot.get_output": {"fullname": "toy_robot.toy_robot.Robot.get_output", "modulename": "toy_robot.toy_robot", "qualname": "Robot.get_output", "kind": "function", "doc": "<p>Get output stream</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> &lt;class &#x27;TextIO&#x27;&gt;:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.Robot.spin": {"fullname": "toy_robot.toy_robot.Robot.spin", "modulename": "toy_robot.toy_robot", "qualname": "Robot.spin", "kind": "function", "doc": "<p>Spin robot to run through the commands. Exits when no more commands to be received.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory", "kind": "class", "doc": "<p>Simple factory for application.</p>\n"}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.__init__", "kind": "function", "doc": "<p>Initialises factory</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">()</span>"}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.add_square_grid", "kind": "function", "doc": "<p>Adds a square grid for the robot:</p>\n\n<p>Args:\n    grid_size(int): Size of square grid.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">grid_size</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">SimpleRobotOnGridFactory</span>:</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.add_stub_command_receiver", "kind": "function", "doc": "<p>Adds a stub file receiver for testing.</p>\n\n<p>Args:\n    file(str): Path to file containing instructions.\n    stream(bool): Read commands lazily instead of parsing the whole file.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span>, </span><span class=\"param\"><span class=\"n\">file</span><span class=\"p\">:</span> <span class=\"nb\">str</span>, </span><span class=\"param\"><span class=\"n\">stream</span><span class=\"p\">:</span> <span class=\"nb\">bool</span> <span class=\"o\">=</span> <span class=\"kc\">False</span></span><span class=\"return-annotation\">):</span></span>", "funcdef": "def"}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"fullname": "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot", "modulename": "toy_robot.toy_robot", "qualname": "SimpleRobotOnGridFactory.create_robot", "kind": "function", "doc": "<p>Adds a square grid for the robot:</p>\n\n<p>Args:\n    grid_size(int): Size of square grid.\nRaises:\n    Runtime error if grid or command receiver are not initaliased.</p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"bp\">self</span></span><span class=\"return-annotation\">) -> <span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">toy_robot</span><span class=\"o\">.</span><span class=\"n\">SimpleRobotOnGridFactory</span>:</span></span>", "funcdef": "def"}, "toy_robot.utils": {"fullname": "toy_robot.utils", "modulename": "toy_robot.utils", "kind": "module", "doc": "<p></p>\n"}, "toy_robot.utils.Direction": {"fullname": "toy_robot.utils.Direction", "modulename": "toy_robot.utils", "qualname": "Direction", "kind": "class", "doc": "<p>Possible directions of toy robot.</p>\n", "bases": "enum.IntEnum"}, "toy_robot.utils.Direction.NORTH": {"fullname": "toy_robot.utils.Direction.NORTH", "modulename": "toy_robot.utils", "qualname": "Direction.NORTH", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.NORTH: 0&gt;"}, "toy_robot.utils.Direction.EAST": {"fullname": "toy_robot.utils.Direction.EAST", "modulename": "toy_robot.utils", "qualname": "Direction.EAST", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.EAST: 1&gt;"}, "toy_robot.utils.Direction.SOUTH": {"fullname": "toy_robot.utils.Direction.SOUTH", "modulename": "toy_robot.utils", "qualname": "Direction.SOUTH", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.SOUTH: 2&gt;"}, "toy_robot.utils.Direction.WEST": {"fullname": "toy_robot.utils.Direction.WEST", "modulename": "toy_robot.utils", "qualname": "Direction.WEST", "kind": "variable", "doc": "<p></p>\n", "default_value": "&lt;Direction.WEST: 3&gt;"}, "toy_robot.utils.Direction.opposite": {"fullname": "toy_robot.utils.Direction.opposite", "modulename": "toy_robot.utils", "qualname": "Direction.opposite", "kind": "variable", "doc": "<p>Property to retrieve the opposite of the current direction.</p>\n"}, "toy_robot.utils.Direction.counter_clockwise": {"fullname": "toy_robot.utils.Direction.counter_clockwise", "modulename": "toy_robot.utils", "qualname": "Direction.counter_clockwise", "kind": "variable", "doc": "<p>Property to retrieve the counter clockwise direction of the current direction.</p>\n"}, "toy_robot.utils.Direction.clockwise": {"fullname": "toy_robot.utils.Direction.clockwise", "modulename": "toy_robot.utils", "qualname": "Direction.clockwise", "kind": "variable", "doc": "<p>Property to retrieve the clockwise direction of the current direction.</p>\n"}, "toy_robot.utils.Coordinates": {"fullname": "toy_robot.utils.Coordinates", "modulename": "toy_robot.utils", "qualname": "Coordinates", "kind": "class", "doc": "<p>Immutable dataclass representing coordinates on a grid system.</p>\n"}, "toy_robot.utils.Coordinates.__init__": {"fullname": "toy_robot.utils.Coordinates.__init__", "modulename": "toy_robot.utils", "qualname": "Coordinates.__init__", "kind": "function", "doc": "<p></p>\n", "signature": "<span class=\"signature pdoc-code condensed\">(<span class=\"param\"><span class=\"n\">x</span><span class=\"p\">:</span> <span class=\"nb\">int</span>, </span><span class=\"param\"><span class=\"n\">y</span><span class=\"p\">:</span> <span class=\"nb\">int</span></span>)</span>"}, "toy_robot.utils.Coordinates.x": {"fullname": "toy_robot.utils.Coordinates.x", "modulename": "toy_robot.utils", "qualname": "Coordinates.x", "kind": "variable", "doc": "<p></p>\n", "annotation": ": int"}, "toy_robot.utils.Coordinates.y": {"fullname": "toy_robot.utils.Coordinates.y", "modulename": "toy_robot.utils", "qualname": "Coordinates.y", "kind": "variable", "doc": "<p></p>\n", "annotation": ": int"}}, "docInfo": {"toy_robot": {"qualname": 0, "fullname": 2, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 15}, "toy_robot.cell": {"qualname": 0, "fullname": 3, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.cell.Cell": {"qualname": 1, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 9}, "toy_robot.cell.Cell.__init__": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 24, "bases": 0, "doc": 34}, "toy_robot.cell.Cell.set_neighbour": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 59, "bases": 0, "doc": 35}, "toy_robot.cell.Cell.get_neighbour": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 46, "bases": 0, "doc": 31}, "toy_robot.cell.Cell.get_coordinates": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 25, "bases": 0, "doc": 23}, "toy_robot.grid": {"qualname": 0, "fullname": 3, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.grid.AbstractGrid": {"qualname": 1, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 14}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"qualname": 5, "fullname": 8, "annotation": 0, "default_value": 0, "signature": 70, "bases": 0, "doc": 43}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"qualname": 4, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 35, "bases": 0, "doc": 34}, "toy_robot.grid.SquareGrid": {"qualname": 1, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 11}, "toy_robot.grid.SquareGrid.__init__": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 14, "bases": 0, "doc": 32}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"qualname": 5, "fullname": 8, "annotation": 0, "default_value": 0, "signature": 70, "bases": 0, "doc": 43}, "toy_robot.grid.SquareGrid.is_valid_cell": {"qualname": 4, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 35, "bases": 0, "doc": 34}, "toy_robot.toy_robot": {"qualname": 0, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.toy_robot.logger": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 10, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.toy_robot.RobotRotation": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 9}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.toy_robot.RobotRotation.LEFT": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.toy_robot.RobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 7}, "toy_robot.toy_robot.RobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 28}, "toy_robot.toy_robot.NopRobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 7}, "toy_robot.toy_robot.NopRobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 24}, "toy_robot.toy_robot.PlaceRobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 7}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 48, "bases": 0, "doc": 8}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 33, "bases": 0, "doc": 30}, "toy_robot.toy_robot.MoveRobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 7}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 30}, "toy_robot.toy_robot.TurnRobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 7}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 27, "bases": 0, "doc": 8}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 30}, "toy_robot.toy_robot.ReportRobotCommand": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 7}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 30}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 9}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 31, "bases": 0, "doc": 28}, "toy_robot.toy_robot.RobotApiHandler": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 11}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"qualname": 4, "fullname": 8, "annotation": 0, "default_value": 47, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 36, "bases": 0, "doc": 26}, "toy_robot.toy_robot.AbstractCommandReceiver": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 8}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 26, "bases": 0, "doc": 10}, "toy_robot.toy_robot.StubFileCommandReceiver": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 1, "doc": 8}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 53, "bases": 0, "doc": 87}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 26, "bases": 0, "doc": 10}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 14, "bases": 0, "doc": 17}, "toy_robot.toy_robot.Robot": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 12}, "toy_robot.toy_robot.Robot.__init__": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 74, "bases": 0, "doc": 41}, "toy_robot.toy_robot.Robot.direction": {"qualname": 2, "fullname": 6, "annotation": 5, "default_value": 0, "signature": 0, "bases": 0, "doc": 4}, "toy_robot.toy_robot.Robot.coordinates": {"qualname": 2, "fullname": 6, "annotation": 5, "default_value": 0, "signature": 0, "bases": 0, "doc": 4}, "toy_robot.toy_robot.Robot.is_on_grid": {"qualname": 4, "fullname": 8, "annotation": 0, "default_value": 0, "signature": 14, "bases": 0, "doc": 26}, "toy_robot.toy_robot.Robot.get_grid": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 25, "bases": 0, "doc": 4}, "toy_robot.toy_robot.Robot.get_output": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 18, "bases": 0, "doc": 5}, "toy_robot.toy_robot.Robot.spin": {"qualname": 2, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 11, "bases": 0, "doc": 18}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"qualname": 1, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 7}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 4, "bases": 0, "doc": 4}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"qualname": 4, "fullname": 8, "annotation": 0, "default_value": 0, "signature": 37, "bases": 0, "doc": 21}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"qualname": 5, "fullname": 9, "annotation": 0, "default_value": 0, "signature": 38, "bases": 0, "doc": 34}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"qualname": 3, "fullname": 7, "annotation": 0, "default_value": 0, "signature": 26, "bases": 0, "doc": 32}, "toy_robot.utils": {"qualname": 0, "fullname": 3, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Direction": {"qualname": 1, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 2, "doc": 8}, "toy_robot.utils.Direction.NORTH": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Direction.EAST": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Direction.SOUTH": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Direction.WEST": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 7, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Direction.opposite": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 12}, "toy_robot.utils.Direction.counter_clockwise": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 14}, "toy_robot.utils.Direction.clockwise": {"qualname": 2, "fullname": 5, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 13}, "toy_robot.utils.Coordinates": {"qualname": 1, "fullname": 4, "annotation": 0, "default_value": 0, "signature": 0, "bases": 0, "doc": 11}, "toy_robot.utils.Coordinates.__init__": {"qualname": 3, "fullname": 6, "annotation": 0, "default_value": 0, "signature": 24, "bases": 0, "doc": 3}, "toy_robot.utils.Coordinates.x": {"qualname": 2, "fullname": 5, "annotation": 2, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}, "toy_robot.utils.Coordinates.y": {"qualname": 2, "fullname": 5, "annotation": 2, "default_value": 0, "signature": 0, "bases": 0, "doc": 3}}, "length": 71, "save": true}, "index": {"qualname": {"root": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 8, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell.Cell": {"tf": 1}, "toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 9}}}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 8}}}}}}}}}, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 3}}}}}, "u": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.utils.Direction.counter_clockwise": {"tf": 1}}, "df": 1}}}}}}, "l": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 1}}, "c": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "w": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 2}}}}}}}}, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 1}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 8}}}, "s": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 3}}, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}, "q": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 1, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 4}}}}}}}}}, "t": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "b": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1, "f": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 4}}}}}}}}}}}}}}}}}}}}}}, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}, "i": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 5}}}}}}}}}}}}}}}}}}}}}}}, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.SOUTH": {"tf": 1}}, "df": 1}}}}}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}}, "df": 2}}}}}}}, "x": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 2}}}, "o": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.NORTH": {"tf": 1}}, "df": 1}}}}}, "g": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 6}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}}}}}}}, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 3}}}}, "a": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}}, "df": 3}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}}}}}}}}, "p": {"docs": {}, "df": 0, "i": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}, "d": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "v": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 2}}}}}, "l": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}}, "df": 1}}}}}, "e": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}}, "df": 1}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 9, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}}, "df": 3}}}}}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}}, "df": 1}}}}, "e": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}, "c": {"docs": {}, "df": 0, "v": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}}, "df": 2}, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1}}}}}}}}, "e": {"docs": {}, "df": 0, "x": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 6}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.EAST": {"tf": 1}}, "df": 1}}}}, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}}}}, "m": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "p": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}}, "t": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 9}}}}}}}}}, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 1}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 1}}}}}, "p": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.opposite": {"tf": 1}}, "df": 1}}}}}}}}, "w": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 1}}}}, "x": {"docs": {"toy_robot.utils.Coordinates.x": {"tf": 1}}, "df": 1}, "y": {"docs": {"toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 1}}}, "fullname": {"root": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 8, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.cell": {"tf": 1}, "toy_robot.cell.Cell": {"tf": 1}, "toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid": {"tf": 1}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.logger": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.direction": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.spin": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.4142135623730951}, "toy_robot.utils": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 71}}, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.cell": {"tf": 1}, "toy_robot.cell.Cell": {"tf": 1}, "toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid": {"tf": 1}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.logger": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.direction": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.spin": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.7320508075688772}, "toy_robot.utils": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 71, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}}, "df": 3}}}}}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}}, "df": 1}}}}, "e": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}, "c": {"docs": {}, "df": 0, "v": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}}, "df": 2}, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1}}}}}}}}, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell": {"tf": 1}, "toy_robot.cell.Cell": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 10}}}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 8}}}}}}}}}, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 3}}}}}, "u": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.utils.Direction.counter_clockwise": {"tf": 1}}, "df": 1}}}}}}, "l": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 1}}, "c": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "w": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 2}}}}}}}}, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 1}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 8}}}, "s": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 3}}, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}, "q": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 1, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 4}}}}}}}}}, "t": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "b": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1, "f": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 4}}}}}}}}}}}}}}}}}}}}}}, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}, "i": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 5}}}}}}}}}}}}}}}}}}}}}}}, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.SOUTH": {"tf": 1}}, "df": 1}}}}}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}}, "df": 2}}}}}}}, "x": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 2}}}, "o": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.NORTH": {"tf": 1}}, "df": 1}}}}}, "g": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 6}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}}}}}}}, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid": {"tf": 1}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 11}}}}, "a": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}}, "df": 3}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}}}}}}}}, "p": {"docs": {}, "df": 0, "i": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}, "d": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "v": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 2}}}}}, "l": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}}, "df": 1}}}}}, "e": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}}, "df": 1}}}}, "e": {"docs": {}, "df": 0, "x": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 6}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.EAST": {"tf": 1}}, "df": 1}}}}, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}}, "df": 3}}}}}}}}}}}}}}}}}, "m": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "p": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 1}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 9}}}}}}}}}, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 1}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 1}}}}}, "p": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.opposite": {"tf": 1}}, "df": 1}}}}}}}}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.utils": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 13}}}}}, "w": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 1}}}}, "x": {"docs": {"toy_robot.utils.Coordinates.x": {"tf": 1}}, "df": 1}, "y": {"docs": {"toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 1}}}, "annotation": {"root": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 4, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}}, "df": 2}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}}, "df": 2}}}}}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}}, "df": 2}}}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}}, "df": 1}}}}}}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.Robot.coordinates": {"tf": 1}}, "df": 1}}}}}}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Coordinates.x": {"tf": 1}, "toy_robot.utils.Coordinates.y": {"tf": 1}}, "df": 2}}}}}, "default_value": {"root": {"0": {"docs": {"toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}}, "df": 2}, "1": {"docs": {"toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}}, "df": 2}, "2": {"docs": {"toy_robot.utils.Direction.SOUTH": {"tf": 1}}, "df": 1}, "3": {"docs": {"toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 1}, "docs": {"toy_robot.toy_robot.logger": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 2.6457513110645907}, "toy_robot.utils.Direction.NORTH": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.EAST": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.SOUTH": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.WEST": {"tf": 1.4142135623730951}}, "df": 8, "l": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 7}, "o": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}}, "df": 1}}}}}, "e": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 2}}}}, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1.4142135623730951}}, "df": 1}}, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}}, "df": 1}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1.4142135623730951}}, "df": 1, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}}, "df": 2}}}}}}}}}}}}, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1}}, "df": 2}}}}, "e": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}}, "df": 1}}}}}}, "w": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}}, "df": 1}}}}}}, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 1}}}}, "g": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.logger": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1}, "toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 7}, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 2.23606797749979}}, "df": 1}}}}}}}}, "x": {"2": {"7": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 4.47213595499958}}, "df": 1}, "docs": {}, "df": 0}, "docs": {}, "df": 0}, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}}, "df": 1}}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 2.23606797749979}}, "df": 1}}}}}}}, "m": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.4142135623730951}}, "df": 1}}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.utils.Direction.NORTH": {"tf": 1}, "toy_robot.utils.Direction.EAST": {"tf": 1}, "toy_robot.utils.Direction.SOUTH": {"tf": 1}, "toy_robot.utils.Direction.WEST": {"tf": 1}}, "df": 4}}}}}}}}}, "n": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.NORTH": {"tf": 1}}, "df": 1}}}}}, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.utils.Direction.EAST": {"tf": 1}}, "df": 1}}}}, "s": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.utils.Direction.SOUTH": {"tf": 1}}, "df": 1}}}}}}}, "signature": {"root": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 4.47213595499958}, "toy_robot.cell.Cell.set_neighbour": {"tf": 6.855654600401044}, "toy_robot.cell.Cell.get_neighbour": {"tf": 6}, "toy_robot.cell.Cell.get_coordinates": {"tf": 4.47213595499958}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 7.416198487095663}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 5.291502622129181}, "toy_robot.grid.SquareGrid.__init__": {"tf": 3.4641016151377544}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 7.416198487095663}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 5.291502622129181}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 5.291502622129181}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 5.291502622129181}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 6.164414002968976}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 5.0990195135927845}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 5.291502622129181}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 4.47213595499958}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 5.291502622129181}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 5.291502622129181}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 4.898979485566356}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 5.291502622129181}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 4.47213595499958}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 5.5677643628300215}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 4.47213595499958}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 3.4641016151377544}, "toy_robot.toy_robot.Robot.__init__": {"tf": 7.615773105863909}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 3.4641016151377544}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 4.47213595499958}, "toy_robot.toy_robot.Robot.get_output": {"tf": 3.3166247903554}, "toy_robot.toy_robot.Robot.spin": {"tf": 3.1622776601683795}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 2}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 5.291502622129181}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 5.656854249492381}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 4.47213595499958}, "toy_robot.utils.Coordinates.__init__": {"tf": 4.47213595499958}}, "df": 33, "x": {"2": {"7": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1.4142135623730951}}, "df": 2}, "docs": {}, "df": 0}, "docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 2}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1.4142135623730951}}, "df": 4}}}, "y": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.utils.Coordinates.__init__": {"tf": 1}}, "df": 2}, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "f": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 23}}}, "i": {"docs": {}, "df": 0, "z": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 2}}, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 2}}}}}}}}}}}}}}}}}}}}}}}, "t": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 3, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}}}}}}}, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 3}}}}, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 2}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.4142135623730951}}, "df": 24}}, "e": {"docs": {}, "df": 0, "x": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 2}}}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 2}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.4142135623730951}}, "df": 24, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}}, "df": 1}}}}}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}}, "df": 4}}}}}}}, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}}}}, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}}, "df": 1}}}}}}}, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}}}}}, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}}, "df": 2}}}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}}, "df": 6}}}}}}}}}, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 2}}}}}}, "l": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 1}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 2}}}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}}, "df": 5}}}}}}}}, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}}, "df": 1}}}}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.4142135623730951}}, "df": 8}}}}}, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 10}}}}, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}}, "df": 1}}, "p": {"docs": {}, "df": 0, "i": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}, "b": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}}, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}}, "df": 2}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}}}, "f": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}, "l": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 2}}, "g": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 2}, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}}, "df": 3}}}}, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}}, "p": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}, "bases": {"root": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "c": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1.4142135623730951}}, "df": 4}, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}}, "df": 1}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}}}}, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction": {"tf": 1}}, "df": 2}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}}, "df": 5}}}}}}}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.utils.Direction": {"tf": 1}}, "df": 1}}}}}}}}}, "doc": {"root": {"1": {"0": {"docs": {"toy_robot": {"tf": 1}}, "df": 1}, "docs": {}, "df": 0}, "3": {"2": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}, "docs": {"toy_robot": {"tf": 1}}, "df": 1}, "docs": {"toy_robot": {"tf": 1.7320508075688772}, "toy_robot.cell": {"tf": 1.7320508075688772}, "toy_robot.cell.Cell": {"tf": 1.7320508075688772}, "toy_robot.cell.Cell.__init__": {"tf": 2.8284271247461903}, "toy_robot.cell.Cell.set_neighbour": {"tf": 2.6457513110645907}, "toy_robot.cell.Cell.get_neighbour": {"tf": 2.6457513110645907}, "toy_robot.cell.Cell.get_coordinates": {"tf": 2.449489742783178}, "toy_robot.grid": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 2.8284271247461903}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 2.6457513110645907}, "toy_robot.grid.SquareGrid": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.__init__": {"tf": 2.6457513110645907}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 2.8284271247461903}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 2.6457513110645907}, "toy_robot.toy_robot": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.logger": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotRotation": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotRotation.RIGHT": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotRotation.LEFT": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 2.449489742783178}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotApiHandler.api_generator_map": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 2}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 3}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.__init__": {"tf": 3}, "toy_robot.toy_robot.Robot.direction": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 2.23606797749979}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.spin": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 2.449489742783178}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 2.8284271247461903}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 2.449489742783178}, "toy_robot.utils": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.NORTH": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.EAST": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.SOUTH": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.WEST": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.opposite": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1.7320508075688772}, "toy_robot.utils.Direction.clockwise": {"tf": 1.7320508075688772}, "toy_robot.utils.Coordinates": {"tf": 1.7320508075688772}, "toy_robot.utils.Coordinates.__init__": {"tf": 1.7320508075688772}, "toy_robot.utils.Coordinates.x": {"tf": 1.7320508075688772}, "toy_robot.utils.Coordinates.y": {"tf": 1.7320508075688772}}, "df": 71, "t": {"docs": {}, "df": 0, "o": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.spin": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 18, "y": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}}, "df": 3}}, "h": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 2}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1.7320508075688772}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 2.449489742783178}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.clockwise": {"tf": 1.4142135623730951}}, "df": 24}, "a": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}}, "df": 3}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}}}}, "r": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 9}}}, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}}, "df": 1}}}, "e": {"docs": {}, "df": 0, "x": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1}}}}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1, "t": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 2}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}}, "df": 30, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}}, "df": 4}}}}}}}}}}, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}}, "df": 1}}}}, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}}, "df": 1}}}}}}, "e": {"docs": {}, "df": 0, "q": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot": {"tf": 1}}, "df": 1}}}}}}, "p": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell": {"tf": 1}}, "df": 1}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}}, "df": 2}}}}}}}}}, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 2}}}}, "t": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}}, "df": 17}}}}, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 3}}}}}}, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 7}, "d": {"docs": {"toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 5}}}}}}, "a": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "a": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 3}}}}}, "u": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 1, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}}}}}}}}}}}, "m": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot": {"tf": 1}}, "df": 1}}}, "e": {"docs": {"toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}}, "df": 1}}}, "r": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 2}}}, "a": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 1}}}}}, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}}, "df": 7}, "r": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 7}, "f": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 18}, "p": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 6}}}}}}, "n": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Direction.opposite": {"tf": 1}}, "df": 1}}}}}}}, "t": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "w": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 6}}}}}}}}, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 2}}}}}}, "a": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.cell.Cell": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}}, "df": 20, "t": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 2}, "r": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 21}}, "e": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 6}}, "l": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}}}}, "w": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "y": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}}, "df": 1}}}}, "l": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 1}}, "b": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}}, "df": 5, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 2}}}}, "c": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}}}}}}}}}}}}}}, "d": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}}, "df": 1}}}}}}, "s": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 3}}}, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 3}, "y": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}}, "df": 1}}, "p": {"docs": {}, "df": 0, "i": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 4}, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}}, "df": 1}}}}}}}}}}, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}, "f": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "w": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 1}}}}}}}}}}, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot": {"tf": 1}, "toy_robot.cell.Cell": {"tf": 1}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 2}, "toy_robot.utils.Coordinates": {"tf": 1}}, "df": 18, "s": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}}}}, "i": {"docs": {}, "df": 0, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}}, "df": 1}}}}, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.get_grid": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}}, "df": 4, "s": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1}}, "df": 2}}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 4}, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}}}}, "p": {"docs": {}, "df": 0, "y": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot": {"tf": 1}}, "df": 1}}}}}, "o": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 3}}}}}, "s": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}, "toy_robot.utils.Direction": {"tf": 1}}, "df": 2}}}}}}}, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}}, "df": 1, "m": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}}, "df": 1}}}}, "s": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}}, "df": 1}, "d": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 2}}}}}, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 1}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}, "t": {"docs": {}, "df": 0, "h": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 3}}}}}}}}, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot": {"tf": 1}}, "df": 1}}}, "z": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}, "i": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}}, "df": 2}}, "n": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 1}}}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}}}}}}}, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell.Cell": {"tf": 1}, "toy_robot.cell.Cell.__init__": {"tf": 1.7320508075688772}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1.7320508075688772}, "toy_robot.cell.Cell.get_neighbour": {"tf": 2}, "toy_robot.cell.Cell.get_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 2.23606797749979}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 2.23606797749979}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}}, "df": 11, "s": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}}, "df": 1}}}}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 2.449489742783178}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 2.23606797749979}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 2.449489742783178}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 2.23606797749979}, "toy_robot.toy_robot.Robot.coordinates": {"tf": 1}, "toy_robot.utils.Coordinates": {"tf": 1}}, "df": 8}}}}}}}, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}}, "df": 1}}}}}}}}}, "p": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}}, "df": 1}}}}, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}}}}}, "m": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.recv": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 22, "s": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 2.23606797749979}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 7}}}}}}, "u": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}}, "df": 2}}}}}, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}}}}}, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}}, "df": 9}}}, "o": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "w": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 3}}}}}}, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 1}}}}}, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1}, "toy_robot.utils.Direction.clockwise": {"tf": 1}}, "df": 6}}}}}}, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}}}}, "l": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}, "n": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}, "h": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "k": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 1}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.cell.Cell": {"tf": 1}, "toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 4, "i": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}}, "df": 1, "s": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}}, "df": 6}}}}}}}, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 1}}}}}}}}}, "t": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 4, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}}, "df": 1}}}}}}}, "s": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}}, "df": 1}}}}, "r": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 3}}}}}}}}, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}}}}, "f": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 15}, "s": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 2}, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}}, "df": 1}}}}}, "s": {"docs": {"toy_robot.toy_robot.PlaceRobotCommand": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}}, "df": 5}}}}}}}}, "m": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.utils.Coordinates": {"tf": 1}}, "df": 1}}}}}}}}}, "x": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}}, "df": 1}, "y": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1.4142135623730951}}, "df": 1}, "h": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "z": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}}, "df": 1}}}}}}}}}, "a": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "d": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 1}}}}}, "s": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1.4142135623730951}}, "df": 1}}}, "v": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.cell.Cell.__init__": {"tf": 1}}, "df": 1}}}}}}}, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 3}}}}}, "s": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 2, "e": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}, "p": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "c": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 4, "s": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}, "h": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}}, "df": 1}}}}}, "t": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 3, "u": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.Robot": {"tf": 1}}, "df": 6}}}}}}, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.RobotApiHandler": {"tf": 1}}, "df": 1}}}, "e": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.get_output": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 4, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 2}}}}}}}, "d": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1}}}}, "u": {"docs": {}, "df": 0, "b": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 1}}}, "q": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.4142135623730951}}, "df": 4, "g": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1}}}}}}}}}, "i": {"docs": {}, "df": 0, "z": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1.4142135623730951}}, "df": 3}}, "m": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}}, "df": 1}}}}}, "u": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 5}}}}}}}}}, "y": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 1, "t": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.utils.Coordinates": {"tf": 1}}, "df": 1}}}}}}, "n": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "g": {"docs": {}, "df": 0, "h": {"docs": {}, "df": 0, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1.4142135623730951}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 3, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 2}, "toy_robot.cell.Cell.get_neighbour": {"tf": 1.7320508075688772}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.4142135623730951}}, "df": 5}}}}}}}}, "b": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "g": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}}, "df": 1}}}}}}}}}, "x": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}}, "df": 1}}}, "o": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 4, "n": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.cell.Cell.get_neighbour": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}}, "df": 4}}, "t": {"docs": {"toy_robot.cell.Cell.get_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 7}}}, "d": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 2.23606797749979}, "toy_robot.cell.Cell.get_neighbour": {"tf": 2.23606797749979}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1.7320508075688772}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.Robot.direction": {"tf": 1}, "toy_robot.utils.Direction.opposite": {"tf": 1}, "toy_robot.utils.Direction.counter_clockwise": {"tf": 1.4142135623730951}, "toy_robot.utils.Direction.clockwise": {"tf": 1.4142135623730951}}, "df": 9, "s": {"docs": {"toy_robot.utils.Direction": {"tf": 1}}, "df": 1}}}}}}}}}, "o": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 2}}}, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "a": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1.4142135623730951}}, "df": 2, "c": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.utils.Coordinates": {"tf": 1}}, "df": 1}}}}}}}}, "e": {"docs": {}, "df": 0, "f": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}, "e": {"docs": {}, "df": 0, "x": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}}, "df": 2, "s": {"docs": {"toy_robot.cell.Cell.set_neighbour": {"tf": 1}}, "df": 1}}}, "t": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}, "e": {"docs": {}, "df": 0, "c": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 6, "s": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}}, "df": 1}}}}}}}, "n": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "m": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.RobotRotation": {"tf": 1}}, "df": 1}}}}}}}}}}, "r": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 1}}}}}, "f": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid": {"tf": 1}, "toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.toy_robot.RobotCommand": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand": {"tf": 1}, "toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.AbstractCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1.4142135623730951}, "toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_square_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.create_robot": {"tf": 1}}, "df": 16}}, "a": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 7}}}, "c": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.toy_robot.SimpleRobotOnGridFactory": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.__init__": {"tf": 1}}, "df": 2}}}}}}, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "m": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}}, "df": 3}}}, "i": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 2.6457513110645907}, "toy_robot.toy_robot.StubFileCommandReceiver.close": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 2}}, "df": 3}}}}, "b": {"docs": {}, "df": 0, "y": {"docs": {"toy_robot.grid.AbstractGrid": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1.4142135623730951}}, "df": 2}, "o": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}, "toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.NopRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 11}}}, "a": {"docs": {}, "df": 0, "s": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.toy_robot.AbastractRobotApiHandler.generate_command": {"tf": 1}, "toy_robot.toy_robot.RobotApiHandler.generate_command": {"tf": 1}}, "df": 2}}}}, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.__init__": {"tf": 1}, "toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 3, "e": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.is_on_grid": {"tf": 1}}, "df": 1}}}}, "q": {"docs": {}, "df": 0, "u": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.grid.AbstractGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}, "toy_robot.grid.SquareGrid.get_next_cell_coordinates": {"tf": 1}, "toy_robot.grid.SquareGrid.is_valid_cell": {"tf": 1}}, "df": 4}}}, "r": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "d": {"docs": {"toy_robot.grid.AbstractGrid.is_valid_cell": {"tf": 1}}, "df": 1}}}}}}}}, "u": {"docs": {}, "df": 0, "p": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}}, "df": 1, "f": {"docs": {}, "df": 0, "r": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "n": {"docs": {}, "df": 0, "t": {"docs": {"toy_robot.grid.SquareGrid.__init__": {"tf": 1}, "toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 2}}}}}}, "n": {"docs": {}, "df": 0, "t": {"docs": {}, "df": 0, "i": {"docs": {}, "df": 0, "l": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}, "w": {"docs": {}, "df": 0, "a": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.RobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.PlaceRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.MoveRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.TurnRobotCommand.execute": {"tf": 1}, "toy_robot.toy_robot.ReportRobotCommand.execute": {"tf": 1}}, "df": 5}}, "h": {"docs": {}, "df": 0, "o": {"docs": {}, "df": 0, "l": {"docs": {}, "df": 0, "e": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}, "toy_robot.toy_robot.SimpleRobotOnGridFactory.add_stub_command_receiver": {"tf": 1}}, "df": 2}}}, "e": {"docs": {}, "df": 0, "n": {"docs": {"toy_robot.toy_robot.Robot.spin": {"tf": 1}}, "df": 1}}}}, "k": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "e": {"docs": {}, "df": 0, "p": {"docs": {}, "df": 0, "s": {"docs": {"toy_robot.toy_robot.StubFileCommandReceiver.__init__": {"tf": 1}}, "df": 1}}}}}}}}, "pipeline": ["trimmer"], "_isPrebuiltIndex": true};
 
     // mirrored in build-search-index.js (part 1)
     // Also split on html tags. this is a cheap heuristic, but good enough.
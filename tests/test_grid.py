@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from toy_robot.grid import Cell, SquareGrid
+from toy_robot.cell import Cell
+from toy_robot.grid import SquareGrid
 from toy_robot.utils import Direction, Coordinates
 
 
@@ -39,6 +40,8 @@ class Test_Grid(unittest.TestCase):
         self.assertEqual(self._grid.is_valid_cell(Coordinates(5, 5)), False)
         self.assertEqual(self._grid.is_valid_cell(Coordinates(0, 5)), False)
         self.assertEqual(self._grid.is_valid_cell(Coordinates(5, 0)), False)
+        self.assertEqual(self._grid.is_valid_cell(Coordinates(-1, 0)), False)
+        self.assertEqual(self._grid.is_valid_cell(Coordinates(0, -1)), False)
 
     def test_get_next_cell_coordinates(self):
         '''Test the SquareGrid.get_next_cell_coordinates method'''
@@ -66,6 +69,25 @@ class Test_Grid(unittest.TestCase):
         self.assertEqual(self._grid.get_next_cell_coordinates(
             Coordinates(4, 4), Direction.NORTH), None)
 
+    def test_get_next_cell_coordinates_cached(self):
+        '''Test the SquareGrid.get_next_cell_coordinates cache on a large grid'''
+        grid = SquareGrid(100)
+        self.assertEqual(grid._next_cache, {})
+        next_coordinates = grid.get_next_cell_coordinates(
+            Coordinates(99, 50), Direction.WEST)
+        self.assertEqual(next_coordinates, Coordinates(98, 50))
+        self.assertIs(grid.get_next_cell_coordinates(
+            Coordinates(99, 50), Direction.WEST), next_coordinates)
+        self.assertEqual(grid.get_next_cell_coordinates(
+            Coordinates(99, 50), Direction.EAST), None)
+
+    def test_str(self):
+        '''Test the SquareGrid string rendering'''
+        self.assertEqual(str(SquareGrid(3)),
+                         '(0,2) (1,2) (2,2)\n'
+                         '(0,1) (1,1) (2,1)\n'
+                         '(0,0) (1,0) (2,0)')
+
 
 if __name__ == "__main__":
     unittest.main()
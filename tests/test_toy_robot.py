@@ -1,9 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from toy_robot.utils import Direction, Coordinates
-from toy_robot.toy_robot import Robot, RobotApiHandler, MoveRobotCommand, PlaceRobotCommand, ReportRobotCommand, TurnRobotCommand, RobotRotation, NopRobotCommand
+from toy_robot.toy_robot import Robot, RobotApiHandler, MoveRobotCommand, PlaceRobotCommand, ReportRobotCommand, TurnRobotCommand, RobotRotation, NopRobotCommand, StubFileCommandReceiver
 from io import StringIO
 from sys import stdout
+import os
+import tempfile
 
 
 class Test_Robot(unittest.TestCase):
@@ -58,10 +60,18 @@ class Test_RobotApiHandlerPlaceCommandGeneration(unittest.TestCase):
         self.assertEqual(command._coordinates, Coordinates(0, 0))
         self.assertEqual(command._direction, Direction.NORTH)
 
+    def test_repeated_place_command_generation(self):
+        '''Test repeated place commands are shared.'''
+        self.assertIs(RobotApiHandler.generate_command('PLACE 1,2,EAST'),
+                      RobotApiHandler.generate_command('PLACE 1,2,EAST'))
+
     def test_incorrect_format_place_command(self):
         '''Test incorrect format.'''
-        command = RobotApiHandler.generate_command('PLACE 0,0')
+        with self.assertLogs('toy_robot.toy_robot', 'WARNING') as logs:
+            command = RobotApiHandler.generate_command('PLACE 0,0')
         self.assertEqual(type(command), NopRobotCommand)
+        self.assertIn('Invalid command format', logs.output[0])
+        self.assertIn('Command PLACE 0,0', logs.output[0])
 
     def test_incorrect_arguments_place_command(self):
         '''Test incorrect arguments.'''
@@ -81,6 +91,24 @@ class Test_RobotApiHandlerMoveCommandGeneration(unittest.TestCase):
         command: MoveRobotCommand = RobotApiHandler.generate_command('MOVE')
         self.assertEqual(type(command), MoveRobotCommand)
 
+    def test_overridden_move_command_generation(self):
+        '''Test subclasses can override command generators.'''
+        command = NopRobotCommand()
+
+        class CustomApiHandler(RobotApiHandler):
+            @staticmethod
+            def _generate_move_command(verb, args):
+                return command
+
+        self.assertIs(CustomApiHandler.generate_command('MOVE'), command)
+        self.assertEqual(
+            type(RobotApiHandler.generate_command('MOVE')), MoveRobotCommand)
+
+    def test_move_command_shared(self):
+        '''Test move commands are shared between generations.'''
+        self.assertIs(RobotApiHandler.generate_command('MOVE'),
+                      RobotApiHandler.generate_command('MOVE'))
+
     def test_incorrect_format_place_command(self):
         '''Test incorrect format.'''
         command = RobotApiHandler.generate_command('MOVE 1')
@@ -148,7 +176,10 @@ class Test_MoveRobotCommand(unittest.TestCase):
         self._robot.is_on_grid.return_value = False
         self._grid.get_next_cell_coordinates = MagicMock()
         self._grid.get_next_cell_coordinates.return_value = Coordinates(1, 1)
-        self.assertEqual(self._move_command.execute(self._robot), False)
+        with self.assertLogs('toy_robot.toy_robot', 'WARNING') as logs:
+            self.assertEqual(self._move_command.execute(self._robot), False)
+        self.assertEqual(logs.output, [
+            'WARNING:toy_robot.toy_robot:Robot not yet placed on grid. Move command not possible.'])
         self.assertEqual(self._robot.coordinates, None)
         self.assertEqual(self._robot.direction, Direction.NORTH)
 
@@ -186,7 +217,10 @@ class Test_PlaceRobotCommand(unittest.TestCase):
         place_command = PlaceRobotCommand(Coordinates(0, 0), Direction.NORTH)
         self._grid.is_valid_cell = MagicMock()
         self._grid.is_valid_cell.return_value = False
-        self.assertEqual(place_command.execute(self._robot), False)
+        with self.assertLogs('toy_robot.toy_robot', 'WARNING') as logs:
+            self.assertEqual(place_command.execute(self._robot), False)
+        self.assertEqual(logs.output, [
+            'WARNING:toy_robot.toy_robot:Cell with coordinates Coordinates(x=0, y=0) not valid.'])
         self.assertEqual(self._robot.coordinates, None)
         self.assertEqual(self._robot.direction, None)
 
@@ -213,6 +247,22 @@ class Test_TurnRobotCommand(unittest.TestCase):
         self.assertEqual(command_right.execute(self._robot), True)
         self.assertEqual(self._robot.direction, Direction.NORTH)
 
+    def test_full_turn(self):
+        '''Test execution of turn commands through all directions.'''
+        self._robot.direction = Direction.NORTH
+        self._robot.is_on_grid = MagicMock()
+        self._robot.is_on_grid.return_value = True
+
+        command_right = TurnRobotCommand(RobotRotation.RIGHT)
+        for direction in [Direction.EAST, Direction.SOUTH, Direction.WEST, Direction.NORTH]:
+            self.assertEqual(command_right.execute(self._robot), True)
+            self.assertEqual(self._robot.direction, direction)
+
+        command_left = TurnRobotCommand(RobotRotation.LEFT)
+        for direction in [Direction.WEST, Direction.SOUTH, Direction.EAST, Direction.NORTH]:
+            self.assertEqual(command_left.execute(self._robot), True)
+            self.assertEqual(self._robot.direction, direction)
+
     def test_invalid_turn_command_robot_not_on_grid(self):
         '''Test invalid turn robot command due to robot not being on the grid.'''
         self._robot.direction = Direction.NORTH
@@ -245,10 +295,62 @@ class Test_ReportRobotCommand(unittest.TestCase):
             self.assertEqual(self._report_command.execute(self._robot), True)
             self.assertEqual(console.getvalue().strip(), "Output: 0,0,NORTH")
 
+    def test_report_command_output(self):
+        '''Test report command writes to the robot output stream.'''
+        output = StringIO()
+        robot = Robot(self._grid, self._command_receiver, output)
+        robot.coordinates = Coordinates(1, 2)
+        robot.direction = Direction.WEST
+        self.assertEqual(self._report_command.execute(robot), True)
+        self.assertEqual(output.getvalue(), "Output: 1,2,WEST\n")
+
     def test_invalid_report_command_robot_not_on_grid(self):
         '''Test valid execution of report command due to robot not being on the grid..'''
         self.assertEqual(self._report_command.execute(self._robot), False)
 
 
+class Test_StubFileCommandReceiver(unittest.TestCase):
+    '''Test the StubFileCommandReceiver class'''
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('PLACE 0,0,NORTH\nMOVE\nREPORT\n')
+        self._file = f.name
+
+    def tearDown(self):
+        os.remove(self._file)
+
+    def test_recv(self):
+        '''Test commands are received in file order.'''
+        receiver = StubFileCommandReceiver(self._file)
+        self.assertEqual(type(receiver.recv()), PlaceRobotCommand)
+        self.assertEqual(type(receiver.recv()), MoveRobotCommand)
+        self.assertEqual(type(receiver.recv()), ReportRobotCommand)
+        self.assertEqual(receiver.recv(), None)
+
+    def test_recv_stream(self):
+        '''Test commands are received in file order when streaming.'''
+        receiver = StubFileCommandReceiver(self._file, stream=True)
+        self.assertEqual(type(receiver.recv()), PlaceRobotCommand)
+        self.assertEqual(type(receiver.recv()), MoveRobotCommand)
+        self.assertEqual(type(receiver.recv()), ReportRobotCommand)
+        self.assertEqual(receiver.recv(), None)
+        self.assertEqual(receiver.recv(), None)
+
+    def test_close_stream(self):
+        '''Test no more commands are received after closing a stream.'''
+        receiver = StubFileCommandReceiver(self._file, stream=True)
+        self.assertEqual(type(receiver.recv()), PlaceRobotCommand)
+        receiver.close()
+        self.assertEqual(receiver.recv(), None)
+
+    def test_missing_file(self):
+        '''Test a missing file raises at construction.'''
+        with self.assertRaises(FileNotFoundError):
+            StubFileCommandReceiver(self._file + '.missing')
+        with self.assertRaises(FileNotFoundError):
+            StubFileCommandReceiver(self._file + '.missing', stream=True)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from toy_robot.utils import Direction
+from toy_robot.utils import Direction, Coordinates
+from dataclasses import FrozenInstanceError
 
 
 class Test_Direction(unittest.TestCase):
@@ -39,6 +40,33 @@ class Test_Direction(unittest.TestCase):
         direction = Direction.EAST
         self.assertEqual(direction.counter_clockwise, Direction.NORTH)
 
+    def test_read_only(self):
+        '''Test that rotation properties can not be assigned'''
+        with self.assertRaises(AttributeError):
+            Direction.NORTH.clockwise = Direction.NORTH
+        self.assertEqual(Direction.NORTH.clockwise, Direction.EAST)
+
+    def test_str(self):
+        '''Test that directions render by name'''
+        self.assertEqual(str(Direction.WEST), 'Direction.WEST')
+        self.assertEqual(f'{Direction.WEST}', 'Direction.WEST')
+        self.assertTrue(Direction.NORTH)
+
+
+class Test_Coordinates(unittest.TestCase):
+    '''Unit tests for Coordinates class'''
+
+    def test_immutable(self):
+        '''Test that coordinates can not be modified'''
+        coordinates = Coordinates(1, 2)
+        with self.assertRaises(FrozenInstanceError):
+            coordinates.x = 3
+        self.assertEqual(coordinates, Coordinates(1, 2))
+
+    def test_hash(self):
+        '''Test that equal coordinates have equal hashes'''
+        self.assertEqual(hash(Coordinates(1, 2)), hash(Coordinates(1, 2)))
+
 
 if __name__ == "__main__":
     unittest.main()
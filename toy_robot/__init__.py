@@ -0,0 +1,3 @@
+'''
+Toy robot moving on a grid. Requires Python 3.10 or later.
+'''
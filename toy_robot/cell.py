@@ -0,0 +1,63 @@
+from toy_robot.utils import Direction, Coordinates
+from typing import List, Optional
+
+
+class Cell:
+    """Represents a cell in a grid."""
+    __slots__ = ('_coordinates', '_neighbours')
+
+    def __init__(self, x: int, y: int):
+        """
+        Initialise a cell at a given (x, y) coordinate.
+
+        Args:
+            x (int): The horizontal position of the cell.
+            y (int): The vertical position of the cell.
+        """
+        self._coordinates = Coordinates(x, y)
+        self._neighbours: List[Optional[Cell]] = [None, None, None, None]
+
+    def set_neighbour(self, neighbour: 'Cell', direction: Direction) -> None:
+        """
+        Set the neighbouring cell at a specific direction.
+
+        Args:
+            neighbour (Cell): The neighbouring cell.
+            direction (Direction): The neighbouring direction.
+        Raises:
+            RuntimeError if neighbour already exists in neighbouring direction
+        """
+        if self._neighbours[direction] is not None:
+            raise RuntimeError(
+                f"Cell already has a neighbour in direction {direction.name}")
+        self._neighbours[direction] = neighbour
+        neighbour._neighbours[direction.opposite] = self
+
+    def get_neighbour(self, direction: Direction) -> 'Cell':
+        """
+        Gets neighbouring cell in specific direction.
+
+        Args:
+            direction (Direction): The neighbouring direction.
+        Returns:
+            Cell: Neigbouring cell, or None if no neighbouring cell in direction.
+        """
+        return self._neighbours[direction]
+
+    def get_coordinates(self) -> Coordinates:
+        '''
+        Gets coordinates of the cell.
+
+        Returns:
+            Coordinates: Coordinates of the cell. The instance is shared, not copied.
+        '''
+        return self._coordinates
+
+    def __str__(self):
+        neighbours = {
+            Direction(direction).name: f"Cell coordinates {cell.get_coordinates()}"
+            for direction, cell in enumerate(self._neighbours) if cell is not None}
+        return f'Coordinates ({self._coordinates}) neighbours {neighbours}'
+
+    def __eq__(self, other: 'Cell') -> bool:
+        return self._coordinates.x == other._coordinates.x and self._coordinates.y == other._coordinates.y
@@ -1,73 +1,46 @@
 from toy_robot.utils import Direction, Coordinates
 from abc import ABC
-from typing import Dict, List
+from typing import Dict, Optional, Tuple
 from abc import abstractmethod
 
 
-class Cell:
-    """Represents a cell in a grid."""
+_DELTAS: Dict[Direction, Tuple[int, int]] = {
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+    Direction.NORTH: (0, 1),
+    Direction.SOUTH: (0, -1)
+}
 
-    def __init__(self, x: int, y: int):
-        """
-        Initialise a cell at a given (x, y) coordinate.
+_EAGER_CACHE_MAX_SIZE = 32
 
-        Args:
-            x (int): The horizontal position of the cell.
-            y (int): The vertical position of the cell.
-        """
-        self._coordinates = Coordinates(x, y)
-        self._neighbours: Dict[Direction, Cell] = {}
-
-    def set_neighbour(self, neighbour: 'Cell', direction: Direction) -> None:
-        """
-        Set the neighbouring cell at a specific direction.
-
-        Args:
-            neighbour (Cell): The neighbouring cell.
-            direction (Direction): The neighbouring direction.
-        Raises:
-            RuntimeError if neighbour already exists in neighbouring direction
-        """
-        if direction in self._neighbours.keys():
-            raise RuntimeError(
-                "Cell already has a neighbour in direction {direction.name}")
-        self._neighbours[direction] = neighbour
-        neighbour._neighbours[direction.opposite] = self
-
-    def get_neighbour(self, direction: Direction) -> 'Cell':
-        """
-        Gets neighbouring cell in specific direction.
-
-        Args:
-            direction (Direction): The neighbouring direction.
-        Returns:
-            Cell: Neigbouring cell, or None if no neighbouring cell in direction.
-        """
-        return self._neighbours.get(direction, None)
-
-    def get_coordinates(self) -> Coordinates:
-        '''
-        Gets coordinates of the cell.
-
-        Returns:
-            Coordinates: Coordinates of the cell.
-        '''
-        return Coordinates(self._coordinates.x, self._coordinates.y)
 
-    def __str__(self):
-        neighbours = {
-            direction.name: f"Cell coordinates {cell.get_coordinates()}" for direction,
-            cell in self._neighbours.items()}
-        return f'Coordinates ({self._coordinates}) neighbours {neighbours}'
-
-    def __eq__(self, other: 'Cell') -> bool:
-        return self._coordinates.x == other._coordinates.x and self._coordinates.y == other._coordinates.y
+def _next_cell(x: int, y: int, direction: Direction,
+               size: int) -> Optional[Tuple[int, int]]:
+    '''
+    Computes the neighbouring cell of (x, y) on a square grid.
+
+    Args:
+        x (int): Horizontal position of current cell.
+        y (int): Vertical position of current cell.
+        direction (Direction): Direction of current's cell neighbour.
+        size (int): Size of square grid.
+    Returns:
+        Tuple[int, int]: Position of neighbouring cell, or None if cell does not exist.
+    '''
+    dx, dy = _DELTAS[direction]
+    x += dx
+    y += dy
+    if 0 <= x < size and 0 <= y < size:
+        return x, y
+    return None
 
 
 class AbstractGrid(ABC):
     '''
-    Abstract class for grid like structure that consists of Cell type objects.
+    Abstract class for grid like structure of cells addressed by Coordinates.
     '''
+    __slots__ = ()
+
     @abstractmethod
     def get_next_cell_coordinates(
             self,
@@ -101,30 +74,25 @@ class SquareGrid(AbstractGrid):
     '''
     Implementation of AbstractGrid interface for a square grid.
     '''
+    __slots__ = ('_size', '_next_cache')
 
     def __init__(self, size: int):
         '''
-        Initialises SquareGrid class.
+        Initialises SquareGrid class. Neighbouring cell lookups are cached,
+        and computed upfront for grids of size up to 32.
 
         Args:
             size (int): Size of square grid.
         '''
         self._size: int = size
-        self._cells: List[List[Cell]] = [
-            [Cell(x, y) for y in range(size)] for x in range(size)]
-        self._initialize_neighbors()
-
-    def _initialize_neighbors(self):
-        '''
-        Initialises neighbours of square grid.
-        '''
-        for x in range(self._size):
-            for y in range(self._size):
-                cell: Cell = self._cells[x][y]
-                if x < self._size - 1:
-                    cell.set_neighbour(self._cells[x + 1][y], Direction.EAST)
-                if y < self._size - 1:
-                    cell.set_neighbour(self._cells[x][y + 1], Direction.NORTH)
+        self._next_cache: Dict[Tuple[int, int, Direction],
+                               Optional[Coordinates]] = {}
+        if size <= _EAGER_CACHE_MAX_SIZE:
+            for x in range(size):
+                for y in range(size):
+                    for direction in _DELTAS:
+                        self.get_next_cell_coordinates(
+                            Coordinates(x, y), direction)
 
     def get_next_cell_coordinates(
             self,
@@ -139,11 +107,18 @@ class SquareGrid(AbstractGrid):
         Returns:
             Coordinates: Coordinates of neighbouring cell, or None if cell does not exist.
         '''
-        next_cell = self._cells[coordinates.x][coordinates.y].get_neighbour(
-            direction)
-        if next_cell is None:
-            return None
-        return next_cell.get_coordinates()
+        key = (coordinates.x, coordinates.y, direction)
+        try:
+            return self._next_cache[key]
+        except KeyError:
+            pass
+        next_cell = _next_cell(
+            coordinates.x, coordinates.y, direction, self._size)
+        next_coordinates = None
+        if next_cell is not None:
+            next_coordinates = Coordinates(*next_cell)
+        self._next_cache[key] = next_coordinates
+        return next_coordinates
 
     def is_valid_cell(self, coordinates: Coordinates) -> bool:
         '''
@@ -154,8 +129,10 @@ class SquareGrid(AbstractGrid):
         Returns:
             bool: True if coordinates coorespond to valid cell, False if not.
         '''
-        return coordinates.x < self._size and coordinates.y < self._size
+        size = self._size
+        return 0 <= coordinates.x < size and 0 <= coordinates.y < size
 
     def __str__(self):
-        return '\n'.join([str(cell)
-                         for cell_row in self._cells for cell in cell_row])
+        return '\n'.join(
+            ' '.join(f'({x},{y})' for x in range(self._size))
+            for y in reversed(range(self._size)))
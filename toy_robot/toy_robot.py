@@ -2,7 +2,20 @@ from toy_robot.utils import Direction, Coordinates
 from toy_robot.grid import AbstractGrid, SquareGrid
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Iterator, Optional, TextIO
+import logging
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+_DIRECTIONS_BY_NAME = {direction.name: direction for direction in Direction}
+_CLOCKWISE_DIRECTIONS = tuple(direction.clockwise for direction in Direction)
+_COUNTER_CLOCKWISE_DIRECTIONS = tuple(
+    direction.counter_clockwise for direction in Direction)
+_PLACE_ARGS_PATTERN = re.compile(
+    rf'(\d+),(\d+),({"|".join(_DIRECTIONS_BY_NAME)})', re.ASCII)
 
 
 class RobotRotation(Enum):
@@ -13,6 +26,8 @@ class RobotRotation(Enum):
 
 class RobotCommand(ABC):
     '''Abstract class for robot command'''
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, robot: 'Robot') -> bool:
         '''
@@ -27,6 +42,8 @@ class RobotCommand(ABC):
 
 
 class NopRobotCommand(RobotCommand):
+    __slots__ = ()
+
     def execute(self, robot: 'Robot') -> bool:
         '''
         No operation robot command.
@@ -41,6 +58,7 @@ class NopRobotCommand(RobotCommand):
 
 class PlaceRobotCommand(RobotCommand):
     '''Implements a robot place command'''
+    __slots__ = ('_coordinates', '_direction')
 
     def __init__(self, coordinates: Coordinates, direction: Direction):
         '''
@@ -63,12 +81,14 @@ class PlaceRobotCommand(RobotCommand):
             robot.direction = self._direction
             return True
         else:
-            print(f'Cell with coordinates {self._coordinates} not valid.')
+            logger.warning(
+                'Cell with coordinates %s not valid.', self._coordinates)
             return False
 
 
 class MoveRobotCommand(RobotCommand):
     '''Implements a robot move command'''
+    __slots__ = ()
 
     def execute(self, robot: 'Robot') -> bool:
         '''
@@ -80,7 +100,8 @@ class MoveRobotCommand(RobotCommand):
             bool: True if operation was successful, False otherwise.
         '''
         if not robot.is_on_grid():
-            print('Robot not yet placed on grid. Move command not possible.')
+            logger.warning(
+                'Robot not yet placed on grid. Move command not possible.')
             return False
         new_coordinates = robot.get_grid().get_next_cell_coordinates(
             robot.coordinates, robot.direction)
@@ -92,12 +113,17 @@ class MoveRobotCommand(RobotCommand):
 
 class TurnRobotCommand(RobotCommand):
     '''Implements a robot turn command'''
+    __slots__ = ('_robot_rotation', '_next_directions')
 
     def __init__(self, robot_rotation: RobotRotation):
         '''
         Initialises a robot rotation command.
         '''
         self._robot_rotation = robot_rotation
+        if robot_rotation == RobotRotation.RIGHT:
+            self._next_directions = _CLOCKWISE_DIRECTIONS
+        else:
+            self._next_directions = _COUNTER_CLOCKWISE_DIRECTIONS
 
     def execute(self, robot: 'Robot') -> bool:
         '''
@@ -109,17 +135,16 @@ class TurnRobotCommand(RobotCommand):
             bool: True if operation was successful, False otherwise.
         '''
         if not robot.is_on_grid():
-            print('Robot not yet placed on grid. Turn command not possible.')
+            logger.warning(
+                'Robot not yet placed on grid. Turn command not possible.')
             return False
-        if self._robot_rotation == RobotRotation.RIGHT:
-            robot.direction = robot.direction.clockwise
-        else:
-            robot.direction = robot.direction.counter_clockwise
+        robot.direction = self._next_directions[robot.direction]
         return True
 
 
 class ReportRobotCommand(RobotCommand):
     '''Implements a robot report command'''
+    __slots__ = ()
 
     def execute(self, robot: 'Robot') -> bool:
         '''
@@ -131,14 +156,21 @@ class ReportRobotCommand(RobotCommand):
             bool: True if operation was successful, False otherwise.
         '''
         if not robot.is_on_grid():
-            print('Robot not yet placed on grid.')
+            logger.warning('Robot not yet placed on grid.')
             return False
         coordinates = robot.coordinates
-        print(
-            f'Output: {coordinates.x},{coordinates.y},{robot.direction.name}')
+        robot.get_output().write(
+            f'Output: {coordinates.x},{coordinates.y},{robot.direction.name}\n')
         return True
 
 
+_NOP_COMMAND = NopRobotCommand()
+_MOVE_COMMAND = MoveRobotCommand()
+_REPORT_COMMAND = ReportRobotCommand()
+_TURN_COMMANDS_BY_NAME = {
+    rotation.name: TurnRobotCommand(rotation) for rotation in RobotRotation}
+
+
 class AbastractRobotApiHandler(ABC):
     '''Class that generates robot commands from API'''
     @classmethod
@@ -157,18 +189,15 @@ class AbastractRobotApiHandler(ABC):
 
 class RobotApiHandler(AbastractRobotApiHandler):
     '''Class that generates robot commands from string commands.'''
-    initialised = False
-
-    @classmethod
-    def _initialise(cls):
-        cls.initialised = True
-        cls.api_generator_map = {
-            'PLACE': cls._generate_place_command,
-            'MOVE': cls._generate_move_command,
-            'LEFT': cls._generate_turn_command,
-            'RIGHT': cls._generate_turn_command,
-            'REPORT': cls._generate_report_command
-        }
+    # Names of generator methods, resolved through cls so subclasses can
+    # override them.
+    api_generator_map = {
+        'PLACE': '_generate_place_command',
+        'MOVE': '_generate_move_command',
+        'LEFT': '_generate_turn_command',
+        'RIGHT': '_generate_turn_command',
+        'REPORT': '_generate_report_command'
+    }
 
     @classmethod
     def generate_command(cls, command: str) -> RobotCommand:
@@ -179,88 +208,116 @@ class RobotApiHandler(AbastractRobotApiHandler):
         Returns:
             RobotCommand: Robot command generated.    
         '''
-        if not cls.initialised:
-            cls._initialise()
         try:
-            data = command.split(' ')
-            command_generator = cls.api_generator_map.get(data[0], None)
-            if command_generator is None:
-                raise RuntimeError('Not valid command type.')
-            return command_generator(data)
+            return cls._parse_command(command)
         except Exception as e:
-            print(f'Invalid command format. Exception {e}. Command {command}')
-            return NopRobotCommand()
+            logger.warning(
+                'Invalid command format. Exception %s. Command %s', e, command)
+            return _NOP_COMMAND
 
     @classmethod
-    def _generate_place_command(cls, data: List[str]) -> PlaceRobotCommand:
+    @lru_cache(maxsize=1024)
+    def _parse_command(cls, command: str) -> RobotCommand:
+        '''
+        Parses a string command. Results are cached by command string, so
+        repeated commands share one (immutable) command object.
+
+        Args:
+            command(str): Command to parse.
+        Returns:
+            RobotCommand: Robot command generated.
+        Raises:
+            Runtime error if command type is not valid.
+        '''
+        verb, separator, args = command.partition(' ')
+        command_generator = cls.api_generator_map.get(verb, None)
+        if command_generator is None:
+            raise RuntimeError('Not valid command type.')
+        return getattr(cls, command_generator)(
+            verb, args if separator else None)
+
+    @staticmethod
+    def _generate_place_command(
+            verb: str, args: Optional[str]) -> PlaceRobotCommand:
         '''
         Generates a robot place command.
 
+        Args:
+            verb(str): Command verb.
+            args(str): Command arguments, or None if command has no arguments.
         Returns:
             PlaceRobotCommand: Returns a Place robot command with the specified parameters.
         Raises:
             Runtime error if command has invalid format.
             Value error if any of the parameters are not of the expected type.
         '''
-        if len(data) != 2:
+        if args is None:
             raise RuntimeError('Invalid place command format.')
-        params = data[1].split(',')
-
-        if not params[0].isdigit():
-            raise ValueError('X coordinate in not a digit.')
-        if not params[1].isdigit():
-            raise ValueError('X coordinate in not a digit.')
-        if params[2] not in Direction.__members__:
-            raise ValueError('Direction provided in command not implemented.')
-
-        return PlaceRobotCommand(Coordinates(int(params[0]), int(params[1])),
-                                 Direction[params[2]])
+        match = _PLACE_ARGS_PATTERN.fullmatch(args)
+        if match is None:
+            raise ValueError('Invalid place command arguments.')
+        x, y, direction = match.groups()
+        return PlaceRobotCommand(Coordinates(int(x), int(y)),
+                                 _DIRECTIONS_BY_NAME[direction])
 
-    @classmethod
-    def _generate_turn_command(cls, data: List[str]) -> TurnRobotCommand:
+    @staticmethod
+    def _generate_turn_command(
+            verb: str, args: Optional[str]) -> TurnRobotCommand:
         '''
         Generates a robot turn command.
 
+        Args:
+            verb(str): Command verb.
+            args(str): Command arguments, or None if command has no arguments.
         Returns:
             TurnRobotCommand: Returns a Turn robot command with the specified parameters.
         Raises:
             Runtime error if command has invalid format.
             Value error if any of the parameters are not of the expected type.
         '''
-        if len(data) != 1:
+        if args is not None:
             raise RuntimeError('Invalid turn command format.')
-        if data[0] not in RobotRotation.__members__:
+        command = _TURN_COMMANDS_BY_NAME.get(verb, None)
+        if command is None:
             raise RuntimeError('Invalid robot rotation command.')
-        return TurnRobotCommand(RobotRotation[data[0]])
+        return command
 
-    @classmethod
-    def _generate_move_command(cls, data: List[str]) -> MoveRobotCommand:
+    @staticmethod
+    def _generate_move_command(
+            verb: str, args: Optional[str]) -> MoveRobotCommand:
         '''
         Generates a robot move command.
 
+        Args:
+            verb(str): Command verb.
+            args(str): Command arguments, or None if command has no arguments.
         Returns:
             MoveRobotCommand: Returns a Move robot command with the specified parameters.
         Raises:
             Runtime error if command has invalid format.
             Value error if any of the parameters are not of the expected type.
         '''
-        if len(data) != 1:
+        if args is not None:
             raise RuntimeError('Invalid move command format.')
-        return MoveRobotCommand()
+        return _MOVE_COMMAND
 
-    @classmethod
-    def _generate_report_command(cls, data: List[str]) -> MoveRobotCommand:
+    @staticmethod
+    def _generate_report_command(
+            verb: str, args: Optional[str]) -> MoveRobotCommand:
         '''
         Generates a robot report command.
 
+        Args:
+            verb(str): Command verb.
+            args(str): Command arguments, or None if command has no arguments.
         Returns:
             MoveRobotCommand: Returns a Report robot command with the specified parameters.
         Raises:
             Runtime error if command has invalid format.
         '''
-        if len(data) != 1:
+        if args is not None:
             raise RuntimeError('Invalid report command format.')
-        return ReportRobotCommand()
+        return _REPORT_COMMAND
 
 
 class AbstractCommandReceiver(ABC):
@@ -284,24 +341,57 @@ class StubFileCommandReceiver(AbstractCommandReceiver):
     def __init__(
             self,
             file: str,
-            api_handler: AbastractRobotApiHandler = RobotApiHandler):
-        with open(file, 'r') as f:
-            self._commands: list[str] = f.readlines()
-            self._api_handler = api_handler()
+            api_handler: AbastractRobotApiHandler = RobotApiHandler,
+            stream: bool = False):
+        '''
+        Initialises the receiver. By default all commands in the file are
+        parsed upfront, otherwise the file is read and parsed line by line
+        as commands are received. A streaming receiver keeps the file open
+        until all commands are received or close() is called.
+
+        Args:
+            file(str): Path to file containing instructions.
+            api_handler(AbastractRobotApiHandler): Handler generating the robot commands.
+            stream(bool): Read commands lazily instead of parsing the whole file.
+        Raises:
+            OSError if file can not be opened.
+        '''
+        self._api_handler = api_handler()
+        self._file: Optional[TextIO] = open(file, 'r')
+        self._commands: Iterator[RobotCommand] = self._read_commands()
+        if not stream:
+            self._commands = iter(list(self._commands))
+
+    def _read_commands(self) -> Iterator[RobotCommand]:
+        '''
+        Reads robot commands from the open file, closing it once exhausted.
+
+        Returns:
+            Iterator[RobotCommand]: Commands in file order.
+        '''
+        for line in self._file:
+            command = self._api_handler.generate_command(line.strip('\n'))
+            if command is not None:
+                yield command
+        self.close()
 
     def recv(self) -> RobotCommand:
         '''
         Returns:
             RobotCommand: Returns the robot command received.
         '''
-        while True:
-            if len(self._commands) < 1:
-                return None
-            command = self._api_handler.generate_command(
-                self._commands.pop(0).strip('\n'))
-            if command is None:
-                continue
-            return command
+        return next(self._commands, None)
+
+    def close(self) -> None:
+        '''
+        Closes the instructions file. No more commands are received afterwards
+        from a streaming receiver.
+        '''
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self._commands = iter(())
 
 
 class Robot:
@@ -310,17 +400,21 @@ class Robot:
     def __init__(
             self,
             grid: AbstractGrid,
-            command_receiver: AbstractCommandReceiver):
+            command_receiver: AbstractCommandReceiver,
+            output: Optional[TextIO] = None):
         '''
         Initialises the toy robot.
 
         Args:
             grid(AbstractGrid): Grid for the robo to to be placed.
+            command_receiver(AbstractCommandReceiver): Receiver of robot commands.
+            output(TextIO): Stream for robot output, sys.stdout if None.
         '''
         self._coordinates: Coordinates = None
         self._direction: Direction = None
         self._grid = grid
         self._command_receiver = command_receiver
+        self._output = output
 
     @property
     def direction(self) -> Direction:
@@ -333,16 +427,14 @@ class Robot:
         self._direction = direction
 
     @property
-    def coordinates(self):
+    def coordinates(self) -> Coordinates:
         '''Get coordinates'''
-        if self._coordinates is None:
-            return None
-        return Coordinates(self._coordinates.x, self._coordinates.y)
+        return self._coordinates
 
     @coordinates.setter
     def coordinates(self, coordinates: Coordinates):
         '''Set coordinates'''
-        self._coordinates = Coordinates(coordinates.x, coordinates.y)
+        self._coordinates = coordinates
 
     def is_on_grid(self) -> bool:
         '''
@@ -357,14 +449,21 @@ class Robot:
         '''Get grid'''
         return self._grid
 
+    def get_output(self) -> TextIO:
+        '''Get output stream'''
+        if self._output is None:
+            return sys.stdout
+        return self._output
+
     def spin(self):
         '''Spin robot to run through the commands. Exits when no more commands to be received.'''
+        recv = self._command_receiver.recv
         while True:
-            command = self._command_receiver.recv()
+            command = recv()
             if command is None:
                 break
             command.execute(self)
-        print('No more commands to execute...')
+        self.get_output().write('No more commands to execute...\n')
 
 
 class SimpleRobotOnGridFactory:
@@ -386,14 +485,15 @@ class SimpleRobotOnGridFactory:
         self._grid = SquareGrid(grid_size)
         return self
 
-    def add_stub_command_receiver(self, file: str):
+    def add_stub_command_receiver(self, file: str, stream: bool = False):
         '''
         Adds a stub file receiver for testing.
 
         Args:
             file(str): Path to file containing instructions.
+            stream(bool): Read commands lazily instead of parsing the whole file.
         '''
-        self._command_receiver = StubFileCommandReceiver(file)
+        self._command_receiver = StubFileCommandReceiver(file, stream=stream)
         return self
 
     def create_robot(self) -> 'SimpleRobotOnGridFactory':
@@ -1,47 +1,59 @@
-from enum import Enum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
 
 
-class Direction(Enum):
+class Direction(IntEnum):
     '''Possible directions of toy robot.'''
-    WEST = 1
-    EAST = 2
-    NORTH = 3
-    SOUTH = 4
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+    # Keep rendering and truthiness of a plain Enum member.
+    __str__ = Enum.__str__
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __bool__(self) -> bool:
+        return True
 
     @property
     def opposite(self):
         '''Property to retrieve the opposite of the current direction.'''
-        return {
-            Direction.WEST: Direction.EAST,
-            Direction.EAST: Direction.WEST,
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH
-        }[self]
+        return _OPPOSITE[self]
 
     @property
     def counter_clockwise(self):
-        '''Property to retrieve the clockwise direction of the current direction.'''
-        return {
-            Direction.WEST: Direction.SOUTH,
-            Direction.SOUTH: Direction.EAST,
-            Direction.EAST: Direction.NORTH,
-            Direction.NORTH: Direction.WEST
-        }[self]
+        '''Property to retrieve the counter clockwise direction of the current direction.'''
+        return _COUNTER_CLOCKWISE[self]
 
     @property
     def clockwise(self):
-        '''Property to retrieve the counter clockwise direction of the current direction.'''
-        return {
-            Direction.WEST: Direction.NORTH,
-            Direction.NORTH: Direction.EAST,
-            Direction.EAST: Direction.SOUTH,
-            Direction.SOUTH: Direction.WEST
-        }[self]
+        '''Property to retrieve the clockwise direction of the current direction.'''
+        return _CLOCKWISE[self]
+
+
+def _rotate_clockwise(steps: int) -> tuple:
+    '''
+    Builds a lookup table of directions rotated clockwise. Directions are
+    numbered clockwise, so a rotation is a step modulo 4.
+
+    Args:
+        steps (int): Number of quarter turns clockwise.
+    Returns:
+        tuple: Rotated direction indexed by direction.
+    '''
+    return tuple(Direction((direction + steps) & 3) for direction in Direction)
+
+
+_CLOCKWISE = _rotate_clockwise(1)
+_OPPOSITE = _rotate_clockwise(2)
+_COUNTER_CLOCKWISE = _rotate_clockwise(3)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Coordinates:
-    '''Dataclass representing coordinates on a grid system.'''
+    '''Immutable dataclass representing coordinates on a grid system.'''
     x: int
     y: int